@@ -1,57 +1,116 @@
 import numpy as np
 import os
 import multiprocessing
-from typing import Dict, List
+import threading
+from multiprocessing.shared_memory import SharedMemory
+from concurrent.futures import Executor, FIRST_EXCEPTION, wait
+from typing import Dict, Optional, Tuple
 
 from ..schema import MotorParams
 from ..models.motor_model import MotorModel
+from ..exceptions import AnalysisCancelledError
 
+# How often (in seconds) a cancellable run checks its cancel event while chunks are in flight
+_CANCEL_POLL_INTERVAL = 0.05
 
-def analyze_chunk(params: MotorParams, i_chunk: np.ndarray, rpm_chunk: np.ndarray) -> Dict[str, np.ndarray]:
+
+def analyze_slab(params: MotorParams, current_range: np.ndarray, rpm_slab: np.ndarray) -> Dict[str, np.ndarray]:
     """
-    Worker function executed in a separate process to analyze a chunk of the grid.
+    Worker function executed in a separate process to analyze a slab of grid rows.
+    Only the 1-D ranges cross the process boundary; the slab's grid is passed to the model as sparse
+    (1, N) / (M, 1) views, which MotorModel broadcasts, so no full meshgrid is materialised.
     This function must be at the top level of the module for multiprocessing to work.
     """
+    I, RPM = np.meshgrid(current_range, rpm_slab, sparse=True)
     model = MotorModel(params)
-    return model.analyze(i_chunk, rpm_chunk)
+    return model.analyze(I, RPM)
+
+def analyze_slab_into_shm(params: MotorParams, current_range: np.ndarray, rpm_slab: np.ndarray, shm_name: str, grid_shape: Tuple[int, int], row_start: int, dtype: str) -> None:
+    """
+    Analyzes a slab of grid rows and writes the results straight into the caller's shared-memory
+    block, laid out as (len(MotorModel.RESULT_KEYS), *grid_shape) of `dtype`, so no result arrays are pickled back.
+    """
+    res = analyze_slab(params, current_range, rpm_slab)
+    shm = SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray((len(MotorModel.RESULT_KEYS), *grid_shape), dtype=dtype, buffer=shm.buf)
+        row_stop = row_start + len(rpm_slab)
+        for k, key in enumerate(MotorModel.RESULT_KEYS):
+            out[k, row_start:row_stop] = res[key]
+        del out  # Release the buffer export before closing
+    finally:
+        shm.close()
+
+def preimport_worker():
+    """
+    Process-pool initializer: importing this module has already pulled in numpy and the
+    motor model, so workers pay that import cost once at pool start-up, not on the first task.
+    """
+    import numpy  # noqa: F401
+    from ..models import motor_model  # noqa: F401
 
-def run_parallel_analysis(params: MotorParams, current_range: np.ndarray, rpm_range: np.ndarray) -> Dict[str, np.ndarray]:
+def run_parallel_analysis(params: MotorParams, current_range: np.ndarray, rpm_range: np.ndarray, executor: Optional[Executor] = None,
+                          cancel_event: Optional[threading.Event] = None) -> Dict[str, np.ndarray]:
     """
     Runs the motor analysis in parallel by splitting the calculation grid into chunks
     and processing them on different CPU cores.
-    """
-    # Create the full meshgrid
-    I, RPM = np.meshgrid(current_range, rpm_range)
 
+    If `executor` is given (e.g. a long-lived ProcessPoolExecutor) the chunks are submitted to it;
+    otherwise a temporary multiprocessing pool is created for this call. With an executor, setting
+    `cancel_event` drops the chunks that have not started and raises AnalysisCancelledError;
+    chunks already running finish in their worker but their rows are discarded.
+    """
     # Determine the number of processes to use (e.g., number of CPU cores)
     try:
         n_procs = os.cpu_count() or 1
     except NotImplementedError:
         n_procs = 1
 
-    # Split the RPM and I arrays into chunks for each process
-    # We split along the RPM axis (axis=0)
-    rpm_chunks = np.array_split(RPM, n_procs, axis=0)
-    i_chunks = np.array_split(I, n_procs, axis=0)
-
-    # Create a list of tasks for the process pool
-    tasks = [(params, i_chunks[i], rpm_chunks[i]) for i in range(n_procs)]
+    # Split the RPM axis (grid rows) into a few slabs per process so the load stays balanced,
+    # while each task is still a large vectorised block rather than many tiny ones
+    rpm_slabs = [slab for slab in np.array_split(rpm_range, n_procs * 4) if slab.size]
+    if not rpm_slabs or not len(current_range):
+        return {}
 
-    # Use a multiprocessing pool to execute the tasks in parallel
-    with multiprocessing.Pool(processes=n_procs) as pool:
-        chunk_results: List[Dict[str, np.ndarray]] = pool.starmap(analyze_chunk, tasks)
+    grid_shape = (len(rpm_range), len(current_range))
+    n_keys = len(MotorModel.RESULT_KEYS)
+    # Results keep the precision of the input ranges (float32 grids give float32 maps)
+    dtype = np.result_type(current_range, rpm_range, np.float32)
+    row_starts = np.cumsum([0] + [len(slab) for slab in rpm_slabs[:-1]])
 
-    # Stitch the results from all chunks back together
-    if not chunk_results:
-        return {}
+    # Workers write their rows into one shared block instead of pickling result dicts back
+    shm = SharedMemory(create=True, size=n_keys * grid_shape[0] * grid_shape[1] * dtype.itemsize)
+    try:
+        # Create a list of tasks for the process pool
+        tasks = [(params, current_range, rpm_slab, shm.name, grid_shape, int(row_start), dtype.str)
+                 for rpm_slab, row_start in zip(rpm_slabs, row_starts)]
 
-    # Get the keys from the first result dictionary
-    final_result: Dict[str, np.ndarray] = {}
-    keys = chunk_results[0].keys()
+        # Use a multiprocessing pool to execute the tasks in parallel
+        if executor is not None:
+            futures = [executor.submit(analyze_slab_into_shm, *task) for task in tasks]
+            try:
+                pending = futures
+                while pending:
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise AnalysisCancelledError("Analysis cancelled")
+                    timeout = _CANCEL_POLL_INTERVAL if cancel_event is not None else None
+                    done, pending = wait(pending, timeout=timeout, return_when=FIRST_EXCEPTION)
+                    for fut in done:
+                        fut.result()  # Re-raise a worker's exception here
+            finally:
+                # Frees the shared pool for the next run when this one stops early
+                for fut in futures:
+                    fut.cancel()
+        else:
+            with multiprocessing.Pool(processes=n_procs) as pool:
+                pool.starmap(analyze_slab_into_shm, tasks)
 
-    for key in keys:
-        # Concatenate the arrays for this key from all chunk results
-        arrays_to_stitch = [res[key] for res in chunk_results]
-        final_result[key] = np.concatenate(arrays_to_stitch, axis=0)
+        grid = np.ndarray((n_keys, *grid_shape), dtype=dtype, buffer=shm.buf)
+        # Copy out once so the results outlive the shared block
+        final_result: Dict[str, np.ndarray] = {key: grid[k].copy() for k, key in enumerate(MotorModel.RESULT_KEYS)}
+        del grid
+    finally:
+        shm.close()
+        shm.unlink()
 
     return final_result
@@ -1,7 +1,12 @@
+import math
 import numpy as np
 from typing import Dict, Tuple, Optional
 import numpy.typing as npt
 from ..schema import MotorParams
+from ..models._kernels import masked_argmax, _nan_ignoring_argmax
+
+# Result keys whose best valid cell feeds the summary (peak points and the operating envelope)
+_SUMMARY_KEYS = ('efficiency', 'output_power', 'torque', 'rpm', 'current')
 
 class ResultsAnalyzer:
     def __init__(self, params: MotorParams, results: Dict[str, npt.NDArray], current_range: npt.NDArray) -> None:
@@ -9,20 +14,32 @@ class ResultsAnalyzer:
         self.r = results
         self.current_range = current_range
         self.valid_mask = self.r['voltage'] <= self.p.simulation.bus_voltage
+        # One fused pass finds the best valid cell of every summary key
+        best = masked_argmax(self.r['voltage'], self.p.simulation.bus_voltage, *(self.r[k] for k in _SUMMARY_KEYS))
+        self._best_idx: Dict[str, int] = dict(zip(_SUMMARY_KEYS, best.tolist()))
 
     def _get_summary_point(self, key: str) -> Tuple[Optional[float], Optional[Tuple[int, int]]]:
-        if not np.any(self.valid_mask):
-            return None, None
-        
-        data = np.where(self.valid_mask, self.r[key], np.nan)
-        if not np.any(~np.isnan(data)):
+        idx = self._best_idx[key]
+        if idx < 0:
             return None, None
-            
-        idx = np.nanargmax(data)
-        coords: Tuple[int, int] = np.unravel_index(idx, data.shape) # type: ignore
-        val = data[coords]
+
+        src = self.r[key]
+        coords: Tuple[int, int] = np.unravel_index(idx, src.shape) # type: ignore
+        val = src[coords]
         return val, coords
 
+    def _nearest_current_index(self, current: float) -> int:
+        """
+        Index of the grid current closest to `current`, computed from the endpoints since current_range is the
+        uniform linspace built by the callers. Ties resolve to the lower index, as np.argmin would.
+        """
+        n = len(self.current_range)
+        lo, hi = float(self.current_range[0]), float(self.current_range[-1])
+        if n < 2 or hi == lo:
+            return 0
+        pos = (current - lo) / (hi - lo) * (n - 1)
+        return min(max(math.ceil(pos - 0.5), 0), n - 1)
+
     def calculate_summary(self) -> Dict[str, str]:
         summary: Dict[str, str] = {}
 
@@ -45,18 +62,20 @@ class ResultsAnalyzer:
             summary['max_torque_point'] = f"{self.r['rpm'][torque_coords]:.0f} RPM / {self.r['current'][torque_coords]:.1f} A"
 
         # 4. Rated (Continuous) Operation
-        cont_idx = np.argmin(np.abs(self.current_range - self.p.winding.continuous_current))
-        rated_mask = self.valid_mask[:, cont_idx]
-        rated_eff = np.where(rated_mask, self.r['efficiency'][:, cont_idx], np.nan)
-        if np.any(~np.isnan(rated_eff)):
-            rated_idx = np.nanargmax(rated_eff)
-            summary['rated_eff_val'] = f'{rated_eff[rated_idx]*100:.1f} %'
+        cont_idx = self._nearest_current_index(self.p.winding.continuous_current)
+        # Gather the valid rows of the rated-current column into one contiguous 1-D array before the argmax,
+        # rather than reducing over a strided column slice of the C-ordered grid
+        rated_rows = np.flatnonzero(self.valid_mask[:, cont_idx])
+        # NaN efficiencies are skipped, as nanargmax did; the entry is left out if none is numeric
+        rated_idx = _nan_ignoring_argmax(self.r['efficiency'][rated_rows, cont_idx], rated_rows)
+        if rated_idx >= 0:
+            summary['rated_eff_val'] = f"{self.r['efficiency'][rated_idx, cont_idx]*100:.1f} %"
             summary['rated_point'] = f"{self.r['rpm'][rated_idx, cont_idx]:.0f} RPM / {self.r['torque'][rated_idx, cont_idx]:.2f} Nm / {self.r['output_power'][rated_idx, cont_idx]:.1f} W"
 
         # 5. Operating Envelope
-        if np.any(self.valid_mask):
-            max_rpm = np.max(self.r['rpm'][self.valid_mask])
-            max_current = np.max(self.r['current'][self.valid_mask])
+        max_rpm, _ = self._get_summary_point('rpm')
+        max_current, _ = self._get_summary_point('current')
+        if max_rpm is not None and max_current is not None:
             summary['max_rpm_val'] = f'{max_rpm:.0f} RPM'
             summary['max_current_val'] = f'{max_current:.1f} A'
         
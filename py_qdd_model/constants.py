@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-import numpy as np
+import math
 
 class PhysicsConstants:
     """
@@ -9,10 +9,13 @@ class PhysicsConstants:
     COPPER_TEMP_COEFF = 0.00393
     
     # Conversion factor from Revolutions Per Minute (RPM) to Radians per Second.
-    RPM_TO_RAD_PER_SEC = (2 * np.pi) / 60
+    RPM_TO_RAD_PER_SEC = (2 * math.pi) / 60
     
     # Conversion factor from Radians per Second to Revolutions Per Minute (RPM).
-    RAD_PER_SEC_TO_RPM = 60 / (2 * np.pi)
+    RAD_PER_SEC_TO_RPM = 60 / (2 * math.pi)
+
+    # Ratio of line-to-line to phase back-EMF for a star (wye) connected winding.
+    SQRT3 = math.sqrt(3)
     
     # Reference temperature for material properties (e.g., resistance, magnets). Units: °C
     REFERENCE_TEMPERATURE = 25.0
@@ -3,3 +3,7 @@
 class FileOperationError(IOError):
     """Raised when a file operation (read, write) fails."""
     pass
+
+class AnalysisCancelledError(Exception):
+    """Raised inside an analysis that was cancelled before it finished."""
+    pass
@@ -34,7 +34,8 @@ class Translator:
 # Create a singleton instance of the translator
 _translator = Translator(settings.language.lang)
 
-# Global translation function
+# Global translation function, memoised per (key, default) until the language changes
+@functools.lru_cache(maxsize=512)
 def t(key: str, default: str = "") -> Any:
     """A convenient global function to access the translator."""
     return _translator.get(key, default=default)
@@ -43,3 +44,4 @@ def set_language(lang_code: str):
     """Sets the global translator to a new language."""
     global _translator
     _translator = Translator(lang_code)
+    t.cache_clear()
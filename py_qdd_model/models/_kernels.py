@@ -0,0 +1,117 @@
+"""
+Per-cell grid kernels for the motor analysis and its post-processing.
+
+Numba is optional: when it is installed these run as single-pass compiled loops,
+otherwise the NumPy fallbacks with identical semantics are used.
+"""
+import numpy as np
+import numpy.typing as npt
+from typing import Tuple
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+if njit is not None:
+    # The kernels are serial: analyses already run one per pool worker process, so numba threads
+    # would oversubscribe the cores, and the plot grid is too small to gain from them.
+    # fastmath is left off on purpose: its no-NaN assumption would break the NaN fill.
+    @njit(cache=True)
+    def _mask_scale_kernel(src, volt, vmax, scale, out):
+        s = src.ravel()
+        v = volt.ravel()
+        o = out.ravel()
+        for i in range(o.size):
+            if v[i] <= vmax:
+                o[i] = s[i] * scale
+            else:
+                o[i] = np.nan
+
+    # A serial sweep: the running "first maximum" per key is order-dependent, and the pass is memory-bound anyway.
+    @njit(cache=True)
+    def _masked_argmax_kernel(volt, vmax, arrays):
+        n = len(arrays)
+        best = np.full(n, -np.inf)
+        idx = np.full(n, -1, np.int64)
+        for i in range(volt.size):
+            if volt[i] <= vmax:
+                for k in range(n):
+                    x = arrays[k][i]
+                    # NaN is skipped; the first numeric valid cell seeds the key, so -inf can still win
+                    if x == x and (idx[k] < 0 or x > best[k]):
+                        best[k] = x
+                        idx[k] = i
+        return idx
+
+    @njit(cache=True)
+    def _relax_temperature_kernel(prev, loss, ambient, r_th, relax, r0, coeff, t_ref, threshold, temp_out, res_out):
+        n_unconverged = 0
+        for i in range(prev.size):
+            t = prev[i] + relax * (ambient + loss[i] * r_th - prev[i])
+            temp_out[i] = t
+            res_out[i] = r0 * (1 + coeff * (t - t_ref))
+            # Written as "not below" so that NaN counts as unconverged, as in the NumPy path
+            if not abs(t - prev[i]) < threshold:
+                n_unconverged += 1
+        return n_unconverged
+
+
+def mask_scale(src: npt.NDArray, volt: npt.NDArray, vmax: float, scale: float, out: npt.NDArray) -> npt.NDArray:
+    """
+    Writes `src * scale` into `out` where `volt <= vmax` and NaN elsewhere.
+    All arrays must share one shape. The compiled kernel writes through `out.ravel()`, which
+    would be a copy for a non-contiguous `out`, so such an `out` takes the NumPy path.
+    """
+    if njit is not None and out.flags.c_contiguous:
+        _mask_scale_kernel(np.ascontiguousarray(src), np.ascontiguousarray(volt), vmax, scale, out)
+        return out
+    valid = volt <= vmax
+    np.multiply(src, scale, out=out, where=valid)
+    np.putmask(out, ~valid, np.nan)
+    return out
+
+
+def relax_temperature(prev_temp: npt.NDArray, total_loss: npt.NDArray, ambient: float, thermal_resistance: float, relax: float,
+                      r0: float, coeff: float, t_ref: float, threshold: float) -> Tuple[npt.NDArray, npt.NDArray, bool]:
+    """
+    One under-relaxed thermal step: moves each cell's temperature towards `ambient + total_loss * thermal_resistance`,
+    re-derives the phase resistance at the new temperature and reports whether every cell moved less than `threshold`.
+    Returns (motor_temp, phase_resistance, converged) as new arrays of `prev_temp`'s shape and dtype.
+    """
+    if njit is not None:
+        prev = np.ascontiguousarray(prev_temp)
+        loss = np.ascontiguousarray(np.broadcast_to(total_loss, prev.shape), dtype=prev.dtype)
+        temp = np.empty_like(prev)
+        res = np.empty_like(prev)
+        n_unconverged = _relax_temperature_kernel(prev.reshape(-1), loss.reshape(-1), ambient, thermal_resistance, relax,
+                                                  r0, coeff, t_ref, threshold, temp.reshape(-1), res.reshape(-1))
+        return temp, res, n_unconverged == 0
+    new_temp = ambient + total_loss * thermal_resistance
+    temp = prev_temp + relax * (new_temp - prev_temp)
+    res = r0 * (1 + coeff * (temp - t_ref))
+    return temp, res, bool(np.all(np.abs(temp - prev_temp) < threshold))
+
+
+def masked_argmax(volt: npt.NDArray, vmax: float, *arrays: npt.NDArray) -> npt.NDArray:
+    """
+    Returns, for each of `arrays`, the flat index of its first maximum over the cells where `volt <= vmax`,
+    ignoring NaN values; -1 for an array with no valid numeric cell. All arrays must share `volt`'s shape.
+    """
+    if njit is not None:
+        dtype = np.result_type(*arrays)
+        flat = tuple(np.ascontiguousarray(a, dtype=dtype).reshape(-1) for a in arrays)
+        return _masked_argmax_kernel(np.ascontiguousarray(volt).reshape(-1), vmax, flat)
+    valid_idx = np.flatnonzero(volt <= vmax)
+    if valid_idx.size == 0:
+        return np.full(len(arrays), -1, dtype=np.int64)
+    return np.array([_nan_ignoring_argmax(np.asarray(a).ravel()[valid_idx], valid_idx) for a in arrays], dtype=np.int64)
+
+
+def _nan_ignoring_argmax(values: npt.NDArray, positions: npt.NDArray) -> int:
+    """The position of the first maximum of `values`, skipping NaN; -1 when no value is numeric."""
+    numeric = ~np.isnan(values)
+    if not numeric.any():
+        return -1
+    return positions[numeric][values[numeric].argmax()]
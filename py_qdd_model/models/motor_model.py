@@ -7,9 +7,12 @@ from .copper_loss import CopperLossModel
 from .iron_loss import IronLossModel
 from .driver_loss import DriverLossModel
 from .gear_loss import GearLossModel
+from ._kernels import relax_temperature
 from .. import constants as C
 
 class MotorModel:
+    # Keys of the result dict returned by analyze(), in a fixed order
+    RESULT_KEYS = ('output_power', 'total_loss', 'efficiency', 'torque', 'voltage', 'current', 'rpm', 'Bmax', 'motor_temp')
 
     def __init__(self, assembly: MotorAssembly):
         self.assembly = assembly
@@ -116,10 +119,12 @@ class MotorModel:
 
     def _initialize_analysis(self, current: npt.NDArray, shaft_rpm: npt.NDArray) -> Dict[str, npt.NDArray]:
         """Prepares the initial state for the analysis."""
-        current = np.asarray(current)
-        shaft_rpm = np.asarray(shaft_rpm)
+        # Sparse (1, N) / (M, 1) grids are expanded here as broadcast views, without copying
+        current, shaft_rpm = np.broadcast_arrays(np.asarray(current), np.asarray(shaft_rpm))
         motor_rpm = self._to_motor_rpm(shaft_rpm)
         motor_omega = self._omega_from_rpm(motor_rpm)
+        # Keep float32 grids in float32 so the whole analysis runs at the input precision
+        dtype = np.result_type(current, np.float32)
 
         return {
             "current": current,
@@ -127,8 +132,8 @@ class MotorModel:
             "motor_rpm": motor_rpm,
             "motor_omega": motor_omega,
             "shaft_omega": self._omega_from_rpm(shaft_rpm),
-            "phase_resistance": np.full_like(current, self.phase_resistance, dtype=float), # Use derived resistance
-            "motor_temp": np.full_like(current, self.assembly.simulation.ambient_temperature, dtype=float),
+            "phase_resistance": np.full_like(current, self.phase_resistance, dtype=dtype), # Use derived resistance
+            "motor_temp": np.full_like(current, self.assembly.simulation.ambient_temperature, dtype=dtype),
             "omega_pos_mask": motor_omega > 0,
         }
 
@@ -136,7 +141,7 @@ class MotorModel:
         """Iteratively calculates losses and temperature until thermal equilibrium is reached."""
         # This method will need to be adapted to the new component structure and thermal model
         for _ in range(iters):
-            prev_temp = state["motor_temp"].copy()
+            prev_temp = state["motor_temp"]
 
             Bmax = self._estimate_flux_density(state["motor_rpm"], voltage_available=self.assembly.simulation.bus_voltage, current=state["current"], motor_temp=state["motor_temp"])
             
@@ -145,13 +150,13 @@ class MotorModel:
 
             # Thermal resistance will need to be derived from components and materials
             thermal_resistance = self.assembly.override_thermal_resistance if self.assembly.override_thermal_resistance is not None else 2.0 # Dummy value
-            new_temp = self.assembly.simulation.ambient_temperature + total_loss * thermal_resistance
-            state["motor_temp"] = prev_temp + relax * (new_temp - prev_temp)
-            
-            # Phase resistance temperature dependency
-            state["phase_resistance"] = self.phase_resistance * (1 + C.PhysicsConstants.COPPER_TEMP_COEFF * (state["motor_temp"] - C.PhysicsConstants.REFERENCE_TEMPERATURE))
+            # Relaxed temperature update, phase resistance temperature dependency and convergence check in one pass
+            state["motor_temp"], state["phase_resistance"], converged = relax_temperature(
+                prev_temp, total_loss, self.assembly.simulation.ambient_temperature, thermal_resistance, relax,
+                self.phase_resistance, C.PhysicsConstants.COPPER_TEMP_COEFF, C.PhysicsConstants.REFERENCE_TEMPERATURE,
+                C.ModelDefaults.CONVERGENCE_THRESHOLD)
 
-            if np.all(np.abs(state["motor_temp"] - prev_temp) < C.ModelDefaults.CONVERGENCE_THRESHOLD):
+            if converged:
                 break
         
         state["Bmax"] = self._estimate_flux_density(state["motor_rpm"], voltage_available=self.assembly.simulation.bus_voltage, current=state["current"], motor_temp=state["motor_temp"])
@@ -46,6 +46,7 @@ COPPER_RESISTIVITY = 1.68e-8  # Ohm*m
 def estimate_new_winding(target_params: Dict[str, float], reference_params: Dict[str, float], density: float) -> Dict[str, float]:
     """
     Estimates new winding properties based on a target and reference motor.
+    Neither input dict is modified.
 
     Args:
         target_params: Dictionary with target motor parameters (requires 'kv', 'peak_current').
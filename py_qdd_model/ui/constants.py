@@ -97,6 +97,11 @@ class Layout:
             (t("Layout.SUMMARY_LAYOUT.labels.max_current"), 'max_current_val')
         ]
     }
+    # SUMMARY_LAYOUT frozen into tuples for the text report, with the "└ " tree prefix already stripped
+    SUMMARY_REPORT_ROWS = tuple(
+        (section, tuple((display.lstrip('└ '), key) for display, key in items))
+        for section, items in SUMMARY_LAYOUT.items()
+    )
 
 class Buttons:
     RUN = t("Buttons.RUN")
@@ -107,6 +112,7 @@ class Buttons:
     WINDING_CALC = t("Buttons.WINDING_CALC")
     GENERATE_3D_MODEL = t("Buttons.GENERATE_3D_MODEL")
     EXPORT_CSV_FUSION = t("Buttons.EXPORT_CSV_FUSION")
+    CANCEL = t("Buttons.CANCEL")
 
 class Dialog:
     class Title:
@@ -131,6 +137,10 @@ class Dialog:
         PLOT_SAVED = t("Dialog.Message.PLOT_SAVED")
         SUMMARY_SAVED = t("Dialog.Message.SUMMARY_SAVED")
         RUN_FIRST = t("Dialog.Message.RUN_FIRST")
+        STATUS_CALCULATING = t("Dialog.Message.STATUS_CALCULATING")
+        STATUS_PLOTTING = t("Dialog.Message.STATUS_PLOTTING")
+        STATUS_CANCELLED = t("Dialog.Message.STATUS_CANCELLED")
+        STATUS_ERROR = t("Dialog.Message.STATUS_ERROR")
         WINDING_CALC_MISSING_PARAMS = t("Dialog.Message.WINDING_CALC_MISSING_PARAMS")
         WINDING_CALC_DENSITY_PROMPT = t("Dialog.Message.WINDING_CALC_DENSITY_PROMPT")
         WINDING_CALC_USE_CUSTOM_REF = t("Dialog.Message.WINDING_CALC_USE_CUSTOM_REF")
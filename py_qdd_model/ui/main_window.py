@@ -1,31 +1,72 @@
 # -*- coding: utf-8 -*-
 import tkinter as tk
 from tkinter import ttk, messagebox
-import numpy as np
 import pathlib
 from pydantic import ValidationError
-from typing import Dict, Any
+from typing import Dict, Any, Callable, TYPE_CHECKING
 from tkinter.filedialog import askdirectory, asksaveasfilename, askopenfilename
 import multiprocessing
+import sys
 import threading
-import queue
+from collections import OrderedDict
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 from ..schema import MotorParams
-from ..models.motor_model import MotorModel
 from ..ui.parameter_panel import ParameterPanel
 from ..ui.summary_panel import SummaryPanel
-from ..ui.plot_view import PlotView
-from ..utils.io import save_json, load_json, save_text
+from ..utils.io import save_json, load_json
 from ..utils import csv_exporter
-from ..analysis.results_analyzer import ResultsAnalyzer
-from ..analysis.parallel_analyzer import run_parallel_analysis
-from ..exceptions import FileOperationError
-from ..three_d import model_generator
+from ..exceptions import FileOperationError, AnalysisCancelledError
 from . import constants as C_UI
 from .. import constants as C_MODEL
 from ..utils.config import settings
 from ..i18n.translator import t
 
+if TYPE_CHECKING:
+    import numpy as np  # numpy is imported lazily at run time so the window opens without it
+
+# Worker processes must not fork this multi-threaded Tk process, so they start from a forkserver
+# ('spawn' is the only option on Windows). The forkserver preloads only what the analysis workers
+# import, and children re-import run_app.py as their main module, which keeps its UI imports under
+# the __main__ guard.
+_MP_CONTEXT = multiprocessing.get_context('spawn' if sys.platform == 'win32' else 'forkserver')
+if sys.platform != 'win32':
+    _MP_CONTEXT.set_forkserver_preload(['numpy', 'py_qdd_model.models'])
+
+# A single long-lived worker runs analyses off the Tk main loop. The grid itself is
+# already split across processes by run_parallel_analysis, so a thread is enough here.
+_ANALYSIS_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analysis")
+
+# Worker processes for the grid chunks live as long as the app, so interpreter start-up
+# and imports are paid once rather than on every run. Created on the first analysis so
+# opening the window does not wait for numpy or the worker processes.
+_POOL = None
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        from ..analysis.parallel_analyzer import preimport_worker
+        # The pool is first created from the analysis thread while Tk is running, so it must not fork this process
+        _POOL = ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=_MP_CONTEXT, initializer=preimport_worker)
+    return _POOL
+
+def _shutdown_pool():
+    """Stops the grid worker processes, dropping any queued chunks."""
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+
+# Number of recent (params, grid settings) analyses kept so re-running an earlier design only replots
+_ANALYSIS_CACHE_SIZE = 8
+
+def _freeze(value: Any) -> Any:
+    """Converts nested parameter dicts into hashable, order-independent tuples."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
 class MainWindow(tk.Frame):
     def __init__(self, master=None):
         super().__init__(master)
@@ -34,37 +75,16 @@ class MainWindow(tk.Frame):
         self.master.geometry(settings.window.initial_size)
         self.pack(fill='both', expand=True)
 
-        self.results_queue = queue.Queue()
         self.param_defs = C_UI.Layout.get_param_defs()
+        self._param_defs_flat = {k: v for section in self.param_defs.values() for k, v in section.items()}
+        csv_exporter.set_default_param_defs(self.param_defs)
 
         left = ttk.Frame(self, padding=settings.layout.main_padding)
         left.pack(side='left', fill='y', anchor='n')
 
-        # Create a scrollable frame for the parameter panel
-        param_container = ttk.Frame(left)
-        param_container.pack(fill="both", expand=True)
-
-        param_canvas = tk.Canvas(param_container)
-        param_v_scrollbar = ttk.Scrollbar(param_container, orient="vertical", command=param_canvas.yview)
-        param_h_scrollbar = ttk.Scrollbar(param_container, orient="horizontal", command=param_canvas.xview)
-        param_scrollable_frame = ttk.Frame(param_canvas)
-
-        param_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: param_canvas.configure(
-                scrollregion=param_canvas.bbox("all")
-            )
-        )
-
-        param_canvas.create_window((0, 0), window=param_scrollable_frame, anchor="nw")
-        param_canvas.configure(yscrollcommand=param_v_scrollbar.set, xscrollcommand=param_h_scrollbar.set)
-
-        self.param_panel = ParameterPanel(param_scrollable_frame, self.param_defs)
-        self.param_panel.pack(fill='x', expand=True)
-
-        param_v_scrollbar.pack(side="left", fill="y")
-        param_h_scrollbar.pack(side="bottom", fill="x")
-        param_canvas.pack(side="left", fill="both", expand=True)
+        # Parameter groups are laid out as notebook tabs, so no scroll region is needed
+        self.param_panel = ParameterPanel(left, self.param_defs)
+        self.param_panel.pack(fill='both', expand=True)
 
         self.summary_panel = SummaryPanel(left, C_UI.Layout.SUMMARY_LAYOUT)
         self.summary_panel.pack(fill='x', pady=settings.layout.widget_pady)
@@ -73,6 +93,8 @@ class MainWindow(tk.Frame):
         btn_frame.pack(pady=settings.layout.widget_pady, fill='x')
         self.run_button = ttk.Button(btn_frame, text=C_UI.Buttons.RUN, command=self.run_analysis)
         self.run_button.pack(side='left', padx=settings.layout.button_padx)
+        self.cancel_button = ttk.Button(btn_frame, text=C_UI.Buttons.CANCEL, command=self.cancel_analysis, state="disabled")
+        self.cancel_button.pack(side='left', padx=settings.layout.button_padx)
         ttk.Button(btn_frame, text=C_UI.Buttons.LOAD_PRESET, command=self.load_preset).pack(side='left', padx=settings.layout.button_padx)
         ttk.Button(btn_frame, text=C_UI.Buttons.SAVE_PRESET, command=self.save_preset).pack(side='left', padx=settings.layout.button_padx)
 
@@ -83,7 +105,8 @@ class MainWindow(tk.Frame):
         ttk.Button(out_frame, text=C_UI.Buttons.GENERATE_3D_MODEL, command=self.generate_3d_model).pack(side='left', padx=settings.layout.button_padx)
         ttk.Button(out_frame, text=C_UI.Buttons.EXPORT_CSV_FUSION, command=self.export_csv_for_fusion).pack(side='left', padx=settings.layout.button_padx)
 
-        self.plot_view = PlotView(self)
+        # matplotlib is imported on the first plot, not while the window first paints
+        self.plot_view = None
 
         z_axis_frame = ttk.Frame(left)
         z_axis_frame.pack(pady=settings.layout.widget_pady, fill='x')
@@ -92,118 +115,246 @@ class MainWindow(tk.Frame):
         z_combo = ttk.Combobox(z_axis_frame, textvariable=self.z_var, values=list(C_UI.Plot.Z_AXIS_MAP.keys()), width=settings.layout.combobox_width, state='readonly')
         z_combo.pack(side='left', padx=5)
         z_combo.bind('<<ComboboxSelected>>', self.on_z_axis_change)
+        # The results key for the selected Z axis is resolved once per selection change, not per redraw
+        self._zkey = C_UI.Plot.Z_AXIS_MAP[self.z_var.get()]
 
         self.results = None
+        self._last_raw, self._last_params = None, None
+        self._fut = None
+        self._fut_key = None
+        self._cancel_event = None
+        self._analysis_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._params_key = None
+        self._last_plot_key = None
+        self._Z_buf = None
+        self._grid_cache = None
+        # params key -> (ke_line, theoretical_max_rpm), so the Tk thread builds a MotorModel at most once per parameter set
+        self._limits_cache: "OrderedDict[str, tuple]" = OrderedDict()
 
         self.status_var = tk.StringVar(value="")
         ttk.Label(left, textvariable=self.status_var, anchor='w').pack(side='bottom', fill='x', pady=5)
 
+        self.master.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Shuts down the analysis workers before closing the window."""
+        self.cancel_analysis()
+        _shutdown_pool()
+        self.master.destroy()
+
     def _get_params_validated(self):
         raw = self.param_panel.get_params()
         if not raw:
             return None
         
+        # Re-validate only when the raw UI values actually changed; the frozen values themselves are
+        # compared, so a hash collision can never return another set of parameters
+        frozen = _freeze(raw)
+        if frozen == self._last_raw:
+            return self._last_params
+
         try:
-            params = MotorParams(**raw)
+            params = MotorParams.model_validate(raw)
+            self._last_raw, self._last_params = frozen, params
             return params
         except ValidationError as e:
             messagebox.showerror(C_UI.Dialog.Title.INPUT_ERROR, C_UI.Dialog.Message.PARAMS_VALIDATION_FAILED.format(e))
             return None
 
+    def _ensure_plot_view(self):
+        if self.plot_view is None:
+            from ..ui.plot_view import PlotView
+            self.plot_view = PlotView(self)
+        return self.plot_view
+
     def run_analysis(self):
         params = self._get_params_validated()
         if params is None:
             return
 
+        self._ensure_plot_view()
+        key = (params.model_dump_json(), settings.analysis.grid_points, settings.analysis.rpm_safety_margin)
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(key)
+            self._show_results(*cached)
+            return
+
         self.run_button.config(state="disabled")
-        self.status_var.set(t("Dialog.Message.STATUS_CALCULATING"))
+        self.cancel_button.config(state="normal")
+        self.status_var.set(C_UI.Dialog.Message.STATUS_CALCULATING)
         
-        thread = threading.Thread(target=self._worker_run_analysis, args=(params,))
-        thread.start()
-        
-        self.after(100, self._check_results_queue)
+        self._cancel_event = threading.Event()
+        self._fut = _ANALYSIS_EXECUTOR.submit(self._worker_run_analysis, params, self._cancel_event)
+        self._fut_key = key
+        self.after(50, self._poll_analysis)
+
+    def _speed_limits(self, params: MotorParams):
+        """Derives the line Ke and the theoretical max shaft RPM from the Ke of the model the analysis runs."""
+        from ..models.motor_model import MotorModel
+        # Read Ke off the model itself so the RPM sweep always matches what analyze() uses
+        ke = MotorModel(params).ke
+        ke_line = ke * C_MODEL.PhysicsConstants.SQRT3 if params.winding.wiring_type == 'star' else ke
 
-    def _worker_run_analysis(self, params: MotorParams):
-        try:
-            temp_model = MotorModel(params)
-            if params.winding.wiring_type == 'star':
-                ke_line = temp_model.ke * np.sqrt(3)
-            else:
-                ke_line = temp_model.ke
+        if ke_line > 0:
+            motor_rpm_unloaded = params.simulation.bus_voltage / ke_line * C_MODEL.PhysicsConstants.RAD_PER_SEC_TO_RPM
+            theoretical_max_rpm = motor_rpm_unloaded / params.gear.gear_ratio
+        else:
+            theoretical_max_rpm = C_MODEL.ModelDefaults.FALLBACK_MAX_RPM
+        return ke_line, theoretical_max_rpm
+
+    def _remember_limits(self, params_key: str, limits: tuple):
+        """Stores the speed limits for `params_key` as the most recently used entry."""
+        self._limits_cache[params_key] = limits
+        self._limits_cache.move_to_end(params_key)
+        if len(self._limits_cache) > _ANALYSIS_CACHE_SIZE:
+            self._limits_cache.popitem(last=False)
+
+    def _worker_run_analysis(self, params: MotorParams, cancel_event: threading.Event):
+        """
+        Runs on the analysis executor; must not touch any Tk state.
+        Stops with AnalysisCancelledError at the next step once `cancel_event` is set, freeing the executor for the next run.
+        """
+        import numpy as np
+        from ..analysis.results_analyzer import ResultsAnalyzer
+        from ..analysis.parallel_analyzer import run_parallel_analysis
+
+        def check_cancelled():
+            if cancel_event.is_set():
+                raise AnalysisCancelledError("Analysis cancelled")
+
+        check_cancelled()
+        ke_line, theoretical_max_rpm = self._speed_limits(params)
+
+        # float32 halves the memory traffic through the model; the map does not need more precision
+        current_range = np.linspace(0.1, params.winding.peak_current, settings.analysis.grid_points, dtype=np.float32)
+        rpm_range = np.linspace(0.1, theoretical_max_rpm * settings.analysis.rpm_safety_margin, settings.analysis.grid_points, dtype=np.float32)
+        
+        results = run_parallel_analysis(params, current_range, rpm_range, executor=_get_pool(), cancel_event=cancel_event)
+        
+        check_cancelled()
+        analyzer = ResultsAnalyzer(params, results, current_range)
+        summary = analyzer.calculate_summary()
+
+        check_cancelled()
+        # JIT-compile the plot kernel here, off the Tk thread, with the argument types the first plot will use
+        from ..models._kernels import mask_scale
+        mask_scale(results['efficiency'][:1, :1], results['voltage'][:1, :1], params.simulation.bus_voltage,
+                   np.float32(1.0), np.empty((1, 1), dtype=np.float32))
+        
+        limits = (params.model_dump_json(), ke_line, theoretical_max_rpm)
+        return results, summary, limits
 
-            if ke_line > 0:
-                motor_rpm_unloaded = params.simulation.bus_voltage / ke_line * C_MODEL.PhysicsConstants.RAD_PER_SEC_TO_RPM
-                theoretical_max_rpm = motor_rpm_unloaded / params.gear.gear_ratio
-            else:
-                theoretical_max_rpm = C_MODEL.ModelDefaults.FALLBACK_MAX_RPM
+    def _poll_analysis(self):
+        fut = self._fut
+        if fut is None:  # Cancelled while waiting
+            return
+        if not fut.done():
+            self.after(50, self._poll_analysis)
+            return
 
-            current_range = np.linspace(0.1, params.winding.peak_current, settings.analysis.grid_points)
-            rpm_range = np.linspace(0.1, theoretical_max_rpm * settings.analysis.rpm_safety_margin, settings.analysis.grid_points)
-            
-            results = run_parallel_analysis(params.model_copy(deep=True), current_range, rpm_range)
-            
-            analyzer = ResultsAnalyzer(params, results, current_range)
-            summary = analyzer.calculate_summary()
-            
-            self.results_queue.put(("success", (results, summary)))
-        except Exception as e:
-            self.results_queue.put(("error", e))
+        self._fut = None
+        self.run_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
 
-    def _check_results_queue(self):
         try:
-            status, data = self.results_queue.get_nowait()
-
-            if status == "success":
-                self.results, summary = data
-                self.summary_panel.update(summary)
-                self.status_var.set(t("Dialog.Message.STATUS_PLOTTING"))
-                self.plot_current_view()
-                self.status_var.set("")
-            elif status == "error":
-                messagebox.showerror(C_UI.Dialog.Title.ERROR, f"An error occurred during analysis:\n{data}")
-                self.status_var.set(t("Dialog.Message.STATUS_ERROR"))
-
-            self.run_button.config(state="normal")
+            outcome = fut.result()
+        except Exception as e:
+            messagebox.showerror(C_UI.Dialog.Title.ERROR, f"An error occurred during analysis:\n{e}")
+            self.status_var.set(C_UI.Dialog.Message.STATUS_ERROR)
+            return
 
-        except queue.Empty:
-            self.after(100, self._check_results_queue)
+        self._analysis_cache[self._fut_key] = outcome
+        if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        self._show_results(*outcome)
+
+    def _show_results(self, results, summary, limits):
+        """Displays a finished (or cached) analysis: stores it, fills the summary and redraws the plot."""
+        if results is not self.results:
+            self._last_plot_key = None  # New results must always be drawn
+        self.results = results
+        params_key, ke_line, theoretical_max_rpm = limits
+        self._remember_limits(params_key, (ke_line, theoretical_max_rpm))
+        # The grid shape only changes with grid_points, so the plot buffer is normally reused across runs
+        import numpy as np
+        if self._Z_buf is None or self._Z_buf.shape != self.results['efficiency'].shape:
+            self._Z_buf = np.empty_like(self.results['efficiency'], dtype=np.float32)
+        self.summary_panel.update(summary)
+        self.status_var.set(C_UI.Dialog.Message.STATUS_PLOTTING)
+        self.plot_current_view()
+        self.status_var.set("")
+
+    def cancel_analysis(self):
+        """
+        Cancels the running analysis. A job still queued never starts; a started one stops at its
+        next step (grid chunks already running in the pool finish) and its result is discarded.
+        """
+        if self._fut is None:
+            return
+        self._cancel_event.set()
+        self._fut.cancel()
+        self._fut = None
+        self.run_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+        self.status_var.set(C_UI.Dialog.Message.STATUS_CANCELLED)
 
     def on_z_axis_change(self, event=None):
-        self.plot_current_view()
+        self._zkey = C_UI.Plot.Z_AXIS_MAP[self.z_var.get()]
+        if self.results is not None:
+            self.plot_current_view()
 
     def plot_current_view(self):
         if self.results is None:
             return
+        import numpy as np
+        from ..models._kernels import mask_scale
 
         params = self._get_params_validated()
         if params is None:
             return
 
-        z_selection = self.z_var.get()
-        zkey = C_UI.Plot.Z_AXIS_MAP[z_selection]
-        Z = self.results[zkey].copy()
-        if zkey == 'efficiency':
-            Z *= 100
+        zkey = self._zkey
 
-        valid_mask = self.results['voltage'] <= params.simulation.bus_voltage
-        Z[~valid_mask] = np.nan
+        # Skip the redraw if neither the Z axis nor the parameters changed
+        self._params_key = params.model_dump_json()
+        if self._last_plot_key == (zkey, self._params_key):
+            return
+
+        # float32 is plenty for colour mapping and halves the bytes handed to matplotlib
+        scale = np.float32(100.0 if zkey == 'efficiency' else 1.0)
+        Z = mask_scale(self.results[zkey], self.results['voltage'], params.simulation.bus_voltage, scale, self._Z_buf)
         
-        current_range = np.linspace(0.1, params.winding.peak_current, settings.analysis.grid_points)
+        current_range = np.linspace(0.1, params.winding.peak_current, settings.analysis.grid_points, dtype=np.float32)
         
-        temp_model = MotorModel(params)
-        if params.winding.wiring_type == 'star':
-            ke_line = temp_model.ke * np.sqrt(3)
-        else:
-            ke_line = temp_model.ke
-        if ke_line > 0:
-            motor_rpm_unloaded = params.simulation.bus_voltage / ke_line * C_MODEL.PhysicsConstants.RAD_PER_SEC_TO_RPM
-            theoretical_max_rpm = motor_rpm_unloaded / params.gear.gear_ratio
-        else:
-            theoretical_max_rpm = C_MODEL.ModelDefaults.FALLBACK_MAX_RPM
-        rpm_range = np.linspace(0.1, theoretical_max_rpm * settings.analysis.rpm_safety_margin, settings.analysis.grid_points)
-        I, RPM = np.meshgrid(current_range, rpm_range)
+        # Reuse the limits derived by an analysis (or an earlier redraw) for these parameters
+        limits = self._limits_cache.get(self._params_key)
+        if limits is None:
+            limits = self._speed_limits(params)
+        self._remember_limits(self._params_key, limits)
+        _, theoretical_max_rpm = limits
+        rpm_range = np.linspace(0.1, theoretical_max_rpm * settings.analysis.rpm_safety_margin, settings.analysis.grid_points, dtype=np.float32)
+        I, RPM = self._fill_grid(current_range, rpm_range)
 
-        self.plot_view.plot(I, RPM, Z, C_UI.Plot.X_AXIS_LABEL, C_UI.Plot.Y_AXIS_LABEL, z_selection, C_UI.Plot.PLOT_TITLE.format(z_selection))
+        z_selection = self.z_var.get()
+        title = C_UI.Plot.PLOT_TITLE.format(z_selection)
+        self._ensure_plot_view()
+        if self.plot_view.surface_shape == Z.shape:
+            self.plot_view.update_surface(I, RPM, Z, z_selection, title)
+        else:
+            self.plot_view.plot(I, RPM, Z, C_UI.Plot.X_AXIS_LABEL, C_UI.Plot.Y_AXIS_LABEL, z_selection, title)
+        self._last_plot_key = (zkey, self._params_key)
+
+    def _fill_grid(self, current_range: "np.ndarray", rpm_range: "np.ndarray"):
+        """Writes the (I, RPM) meshgrid into cached buffers, reallocating only when the grid size changes."""
+        import numpy as np
+        shape = (len(rpm_range), len(current_range))
+        if self._grid_cache is None or self._grid_cache[0].shape != shape:
+            self._grid_cache = (np.empty(shape, dtype=np.float32), np.empty(shape, dtype=np.float32))
+        I, RPM = self._grid_cache
+        np.copyto(I, current_range[None, :])
+        np.copyto(RPM, rpm_range[:, None])
+        return I, RPM
 
     def generate_3d_model(self):
         params = self._get_params_validated()
@@ -215,8 +366,9 @@ class MainWindow(tk.Frame):
             return
         output_dir = pathlib.Path(output_dir_str)
 
+        from ..three_d import model_generator
         try:
-            process = multiprocessing.Process(
+            process = _MP_CONTEXT.Process(
                 target=model_generator.generate_motor_model,
                 args=(params, output_dir)
             )
@@ -235,12 +387,6 @@ class MainWindow(tk.Frame):
         if params is None:
             return
 
-        try:
-            csv_data = csv_exporter.export_params_to_fusion_csv(params, self.param_defs)
-        except Exception as e:
-            messagebox.showerror("CSV Export Error", f"Failed to generate CSV data: {e}")
-            return
-
         fp = asksaveasfilename(
             defaultextension='.csv',
             filetypes=[("CSV files", '*.csv'), ("All files", '*.*')],
@@ -249,12 +395,16 @@ class MainWindow(tk.Frame):
         if not fp:
             return
 
+        # Rows are streamed into the file as they are formatted
         try:
-            with open(fp, 'w', newline='', encoding='utf-8') as f:
-                f.write(csv_data)
-            messagebox.showinfo("CSV Export Complete", f"Parameters saved to {fp}")
+            csv_exporter.export_params_to_fusion_csv_to_path(params, fp)
         except IOError as e:
             messagebox.showerror("CSV Export Error", f"Failed to save CSV file: {e}")
+            return
+        except Exception as e:
+            messagebox.showerror("CSV Export Error", f"Failed to generate CSV data: {e}")
+            return
+        messagebox.showinfo("CSV Export Complete", f"Parameters saved to {fp}")
 
     def save_preset(self):
         fp = asksaveasfilename(defaultextension='.json', filetypes=[C_UI.FileDialog.JSON, C_UI.FileDialog.ALL])
@@ -286,35 +436,24 @@ class MainWindow(tk.Frame):
         fp = asksaveasfilename(defaultextension='.png', filetypes=[C_UI.FileDialog.PNG, C_UI.FileDialog.ALL])
         if not fp: return
         try:
-            self.plot_view.save_png(fp)
+            self._ensure_plot_view().save_png(fp)
             messagebox.showinfo(C_UI.Dialog.Title.SAVE_COMPLETE, C_UI.Dialog.Message.PLOT_SAVED.format(fp))
         except FileOperationError as e:
             messagebox.showerror(C_UI.Dialog.Title.SAVE_ERROR, str(e))
 
-    def _format_params_recursively(self, params_dict: Dict[str, Any], param_defs: Dict, level: int = 0) -> str:
-        """Helper function to recursively format nested parameter dictionaries."""
-        text = ""
+    def _format_params_recursively(self, params_dict: Dict[str, Any], writer: Callable[[str], Any], level: int = 0) -> None:
+        """Helper function to recursively format nested parameter dictionaries, emitting each line via `writer`."""
         indent = "  " * level
-        
-        flat_defs = {}
-        for group_key, group_fields in param_defs.items():
-            is_schema_key = group_key in ["electrical", "winding", "magnets", "geometry", "thermal", "driver", "gear", "simulation"]
-            if is_schema_key:
-                 for key, T in group_fields.items():
-                     flat_defs[key] = T[0]
-            else: # Top-level group
-                for key, T in group_fields.items():
-                    flat_defs[key] = T[0]
 
         for key, value in params_dict.items():
             if isinstance(value, dict):
                 group_label = t(f"Layout.PARAM_DEFS.groups.{key}", default=key.capitalize())
-                text += f"\n{indent}[{group_label}]\n"
-                text += self._format_params_recursively(value, param_defs, level + 1)
+                writer(f"\n{indent}[{group_label}]\n")
+                self._format_params_recursively(value, writer, level + 1)
             else:
-                label = flat_defs.get(key, key)
-                text += f"{indent}- {label}: {value}\n"
-        return text
+                param_def = self._param_defs_flat.get(key)
+                label = param_def[0] if param_def else key
+                writer(f"{indent}- {label}: {value}\n")
 
     def save_summary(self):
         if self.results is None:
@@ -323,22 +462,26 @@ class MainWindow(tk.Frame):
         fp = asksaveasfilename(defaultextension='.txt', filetypes=[C_UI.FileDialog.TXT, C_UI.FileDialog.ALL])
         if not fp: return
 
-        summary_text = f"{C_UI.SummaryReport.TITLE}\n{'='*40}\n"
+        # Tk variables must be read on the UI thread; formatting and writing happen in the worker
         summary_data = self.summary_panel.get_values()
-
-        for section, items in C_UI.Layout.SUMMARY_LAYOUT.items():
-            summary_text += f"\n{section}\n{'-'*len(section)*2}\n"
-            for display, key in items:
-                label = display.lstrip('└ ')
-                value = summary_data.get(key, '-')
-                summary_text += f"{label:>22s}: {value}\n"
-
-        summary_text += f"\n{'='*40}\n{C_UI.SummaryReport.PARAMS_HEADER}\n"
         params = self.param_panel.get_params()
-        summary_text += self._format_params_recursively(params, self.param_defs)
+        threading.Thread(target=self._do_save_summary, args=(fp, summary_data, params), daemon=True).start()
 
+    def _do_save_summary(self, fp: str, summary_data: Dict[str, str], params: Dict[str, Any]):
         try:
-            save_text(fp, summary_text)
-            messagebox.showinfo(C_UI.Dialog.Title.SAVE_COMPLETE, C_UI.Dialog.Message.SUMMARY_SAVED.format(fp))
-        except FileOperationError as e:
-            messagebox.showerror(C_UI.Dialog.Title.SAVE_ERROR, str(e))
\ No newline at end of file
+            # Stream the report straight to the file instead of materialising it in memory
+            with open(fp, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                write = f.write
+                write(f"{C_UI.SummaryReport.TITLE}\n{'='*40}\n")
+
+                for section, rows in C_UI.Layout.SUMMARY_REPORT_ROWS:
+                    write(f"\n{section}\n{'-'*len(section)*2}\n")
+                    for label, key in rows:
+                        value = summary_data.get(key, '-')
+                        write(f"{label:>22s}: {value}\n")
+
+                write(f"\n{'='*40}\n{C_UI.SummaryReport.PARAMS_HEADER}\n")
+                self._format_params_recursively(params, writer=write)
+            self.master.after(0, messagebox.showinfo, C_UI.Dialog.Title.SAVE_COMPLETE, C_UI.Dialog.Message.SUMMARY_SAVED.format(fp))
+        except IOError as e:
+            self.master.after(0, messagebox.showerror, C_UI.Dialog.Title.SAVE_ERROR, f"Failed to save text to {fp}: {e}")
@@ -8,6 +8,10 @@ class ParameterPanel(ttk.Labelframe):
         super().__init__(master, *args, text=t("ParameterPanel.TITLE"), **kwargs)
         self.param_defs = param_defs
         self.vars: Dict[str, Dict[str, tk.Variable]] = {}
+        # Field key -> display label, used for input error messages
+        self._param_labels: Dict[str, str] = {
+            key: value_tuple[0] for group_data in param_defs.values() for key, value_tuple in group_data.items()
+        }
         self._build()
 
         # Create a flat map from schema key to tk.Variable for easy access
@@ -17,22 +21,17 @@ class ParameterPanel(ttk.Labelframe):
                 self.key_to_var_map[field_key] = var
 
     def _build(self):
-        """Builds the UI by creating nested labelframes and widgets based on param_defs."""
-        container = ttk.Frame(self)
-        container.pack(fill='x', expand=True)
+        """Builds the UI by creating one notebook tab per group and widgets based on param_defs."""
+        container = ttk.Notebook(self)
+        container.pack(fill='both', expand=True)
 
-        is_first_group = True
         for group_key, fields in self.param_defs.items():
             is_schema_key = group_key in ["electrical", "winding", "magnets", "geometry", "thermal", "driver", "gear", "simulation"]
             
             frame_label = group_key if not is_schema_key else t(f"Layout.PARAM_DEFS.groups.{group_key}", default=group_key.capitalize())
             
-            if is_first_group:
-                frame = ttk.Frame(container)
-                is_first_group = False
-            else:
-                frame = ttk.LabelFrame(container, text=frame_label, padding=5)
-            frame.pack(fill='x', padx=5, pady=5)
+            frame = ttk.Frame(container, padding=5)
+            container.add(frame, text=frame_label)
 
             self.vars[group_key] = {}
             
@@ -67,11 +66,6 @@ class ParameterPanel(ttk.Labelframe):
     def get_params(self) -> Dict[str, Any]:
         """Recursively gets parameters from the UI and returns them in a nested dictionary."""
         params: Dict[str, Any] = {}
-        
-        param_labels: Dict[str, str] = {}
-        for group_data in self.param_defs.values():
-            for key, value_tuple in group_data.items():
-                param_labels[key] = value_tuple[0]
 
         for group_key, field_vars in self.vars.items():
             is_schema_key = group_key in ["electrical", "winding", "magnets", "geometry", "thermal", "driver", "gear", "simulation"]
@@ -87,7 +81,7 @@ class ParameterPanel(ttk.Labelframe):
                 try:
                     target_dict[key] = var.get()
                 except tk.TclError:
-                    label = param_labels.get(key, key)
+                    label = self._param_labels.get(key, key)
                     messagebox.showerror(
                         t("Dialog.Title.INPUT_ERROR"),
                         t("Dialog.Message.INVALID_NUMERIC_VALUE").format(label)
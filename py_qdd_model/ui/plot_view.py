@@ -1,6 +1,7 @@
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from ..utils.plotting import plot_surface
+from ..utils.plotting import plot_surface, update_surface_data
 from ..utils.config import settings
 from ..exceptions import FileOperationError
 
@@ -11,15 +12,44 @@ class PlotView:
         self.fig = fig or plt.Figure(figsize=figsize, dpi=dpi)
         self.canvas = FigureCanvasTkAgg(self.fig, master=master)
         self.canvas.get_tk_widget().pack(side='right', fill='both', expand=True)
-        self.ax = None
+        # One persistent 3D axes for the lifetime of the view; plot() only clears its contents
+        self.ax = self.fig.add_subplot(111, projection='3d')
+        self._surf = None
+        self._surf_shape = None
+
+    @property
+    def surface_shape(self):
+        """Shape of the grid behind the current surface, or None if nothing is plotted."""
+        return self._surf_shape
 
     def plot(self, X, Y, Z, xlabel, ylabel, zlabel, title):
-        self.fig.clear()
-        self.ax = self.fig.add_subplot(111, projection='3d')
+        self.ax.cla()
         downsample_factor = settings.plot.downsample_factor
-        plot_surface(self.ax, X, Y, Z, xlabel, ylabel, zlabel, title, downsample_factor=downsample_factor)
+        self._surf = plot_surface(self.ax, X, Y, Z, xlabel, ylabel, zlabel, title, downsample_factor=downsample_factor)
+        self._surf_shape = Z.shape
         self.canvas.draw()
 
+    def update_surface(self, X, Y, Z, zlabel, title):
+        """
+        Updates the surface on the existing 3D axes, keeping the figure, axes and (for regular grids) the
+        Poly3DCollection artist alive. Z sets the surface height as well as its colour, so the vertices are replaced.
+        """
+        downsample_factor = settings.plot.downsample_factor
+        if min(Z.shape) >= 2:
+            update_surface_data(self._surf, X, Y, Z, downsample_factor=downsample_factor)
+            self.ax.set_zlabel(zlabel)
+            self.ax.set_title(title, pad=20)
+        else:
+            self._surf.remove()
+            self._surf = plot_surface(self.ax, X, Y, Z, self.ax.get_xlabel(), self.ax.get_ylabel(), zlabel, title, downsample_factor=downsample_factor)
+        self._surf_shape = Z.shape
+        # plot_surface only grows the data limits, so fit them to the new data explicitly
+        self.ax.set_xlim(np.min(X), np.max(X))
+        self.ax.set_ylim(np.min(Y), np.max(Y))
+        if np.any(np.isfinite(Z)):
+            self.ax.set_zlim(np.nanmin(Z), np.nanmax(Z))
+        self.canvas.draw_idle()
+
     def save_png(self, filepath: str):
         try:
             self.fig.savefig(filepath, dpi=settings.plot.save_dpi, facecolor='white')
@@ -1,44 +1,113 @@
+import copy
+import hashlib
+import os
+import pathlib
+import sys
 import tomllib
 from typing import Any, Dict
 from ..schema import AppSettings
 from pydantic import ValidationError
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
 def _deep_merge(source: Dict, destination: Dict) -> Dict:
     """
-    Recursively merges source dict into destination dict.
+    Merges source dict into destination dict, descending into nested dicts with an explicit stack.
     """
-    for key, value in source.items():
-        if isinstance(value, dict):
-            # get node or create one
-            node = destination.setdefault(key, {})
-            _deep_merge(value, node)
-        else:
-            destination[key] = value
+    stack = [(source, destination)]
+    while stack:
+        src, dst = stack.pop()
+        for key, value in src.items():
+            if isinstance(value, dict):
+                # get node or create one
+                stack.append((value, dst.setdefault(key, {})))
+            else:
+                dst[key] = value
     return destination
 
+def _cache_dir() -> pathlib.Path:
+    """The per-user cache directory for this package (never inside the working tree)."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or pathlib.Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = pathlib.Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+    return pathlib.Path(base) / "py_qdd_model"
+
+# Opt-in switch for the parsed-TOML cache, so importing the package (and running the tests) writes nothing by default
+_CACHE_ENV_VAR = "PY_QDD_MODEL_SETTINGS_CACHE"
+
+def _cache_enabled() -> bool:
+    return orjson is not None and os.environ.get(_CACHE_ENV_VAR, "") not in ("", "0")
+
+def _is_json_safe(value: Any) -> bool:
+    """True if `value` round-trips through JSON unchanged (TOML dates and times would come back as strings)."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+        elif not isinstance(item, (str, int, float, bool)) and item is not None:
+            return False
+    return True
+
+def _read_toml(path: str) -> Dict[str, Any]:
+    """
+    Parses a TOML file. When PY_QDD_MODEL_SETTINGS_CACHE is set and orjson is installed, the parsed
+    dict is also cached as JSON in the user cache directory, together with the TOML's (mtime_ns, size),
+    and reused only while both still match. Files holding dates or times are never cached.
+    """
+    if not _cache_enabled():
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+
+    src = pathlib.Path(path).resolve()
+    st = src.stat()  # FileNotFoundError propagates as with open()
+    stamp = [st.st_mtime_ns, st.st_size]
+    cache = _cache_dir() / (hashlib.sha1(str(src).encode("utf-8")).hexdigest() + ".json")
+    try:
+        cached = orjson.loads(cache.read_bytes())
+        if cached["source"] == stamp:
+            return cached["data"]
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+        pass  # Missing, unreadable or foreign cache: reparse the TOML
+
+    with open(src, "rb") as f:
+        data = tomllib.load(f)
+    if _is_json_safe(data):
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            cache.write_bytes(orjson.dumps({"source": stamp, "data": data}))
+        except OSError:
+            pass  # Read-only location: the cache is only an optimisation
+    return data
+
+# Defaults are validated once at import; load_settings merges into a copy of this dump
+_DEFAULT = AppSettings()
+_DEFAULT_DUMP = _DEFAULT.model_dump()
+
 def load_settings(path: str = "settings.toml") -> AppSettings:
     """
     Loads settings from a TOML file, validates them against the AppSettings model,
     and returns a type-safe settings object.
     """
-    # Start with default settings by creating a model instance
-    default_settings_dict = AppSettings().model_dump()
-    
-    final_settings_dict = default_settings_dict
-
     try:
-        with open(path, "rb") as f:
-            user_settings = tomllib.load(f)
-            # Merge user settings into the default settings
-            final_settings_dict = _deep_merge(user_settings, default_settings_dict)
-
+        user_settings = _read_toml(path)
     except FileNotFoundError:
-        # File doesn't exist, use default settings, which is already the case
-        pass
+        # File doesn't exist, use default settings
+        return _DEFAULT
     except tomllib.TOMLDecodeError as e:
         print(f"Warning: Could not parse '{path}'. Using default settings. Error: {e}")
-        # Fallback to defaults
-        final_settings_dict = AppSettings().model_dump()
+        return _DEFAULT
+
+    # Merge user settings into a copy of the default settings
+    final_settings_dict = _deep_merge(user_settings, copy.deepcopy(_DEFAULT_DUMP))
 
     try:
         # Validate the final merged dictionary
@@ -46,8 +115,8 @@ def load_settings(path: str = "settings.toml") -> AppSettings:
         return settings_obj
     except ValidationError as e:
         print(f"Warning: Settings validation failed. Using default settings. Error: {e}")
-        # On validation failure, return a default AppSettings instance
-        return AppSettings()
+        # On validation failure, return the default AppSettings instance
+        return _DEFAULT
 
 # Create a single instance to be imported by other modules
 settings = load_settings()
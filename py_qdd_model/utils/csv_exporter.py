@@ -1,69 +1,134 @@
-import csv
-import io
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from ..schema import MotorParams
 # from ..ui import constants as C_UI # 削除
 # from ..i18n.translator import t # 削除
 
-def _flatten_params(params: MotorParams, param_defs: dict):
+# id(param_defs) -> (param_defs, key -> label). The defs object is kept alive alongside its labels
+# so its id cannot be reused by another dict while the entry exists.
+_LABEL_CACHE: Dict[int, Tuple[dict, Dict[str, str]]] = {}
+_LABEL_CACHE_SIZE = 8
+
+def _param_labels(param_defs: dict) -> Dict[str, str]:
+    """Returns the flat schema-key -> label map for `param_defs`, built once per defs object."""
+    cached = _LABEL_CACHE.get(id(param_defs))
+    if cached is not None and cached[0] is param_defs:
+        return cached[1]
+    labels = {key: label for group_fields in param_defs.values() for key, (label, *_) in group_fields.items()}
+    if len(_LABEL_CACHE) >= _LABEL_CACHE_SIZE:
+        _LABEL_CACHE.pop(next(iter(_LABEL_CACHE)))
+    _LABEL_CACHE[id(param_defs)] = (param_defs, labels)
+    return labels
+
+# Labels used when an export is not given its own param_defs; see set_default_param_defs
+_DEFAULT_LABELS: Optional[Dict[str, str]] = None
+
+def set_default_param_defs(param_defs: dict):
+    """Indexes `param_defs` once as the labels used by exports that do not pass their own."""
+    global _DEFAULT_LABELS
+    _DEFAULT_LABELS = _param_labels(param_defs)
+
+def _flatten_params(params: MotorParams, param_defs: Optional[dict]) -> List[Tuple[str, Any, str]]:
     """
     Flattens the nested Pydantic model into a list of tuples for CSV export.
-    (parameter_name, value, comment_string)
+    (parameter_name, value, comment_string); bools are already converted to 0/1.
     """
-    flat_list = []
+    flat_list: List[Tuple[str, Any, str]] = []
     
-    # Create a flat map from schema key to the label string for easier lookup
-    param_labels = {}
-    for group_fields in param_defs.values():
-        for key, (label, *_) in group_fields.items():
-            param_labels[key] = label
-
-    def recurse(model_part, prefix=""):
-        for field_name, value in model_part:
+    # Flat map from schema key to the label string, cached across exports
+    if param_defs is not None:
+        param_labels = _param_labels(param_defs)
+    elif _DEFAULT_LABELS is not None:
+        param_labels = _DEFAULT_LABELS
+    else:
+        raise ValueError("No param_defs given and none registered with set_default_param_defs")
+
+    def recurse(data: Dict[str, Any], prefix: str = "") -> None:
+        for field_name, value in data.items():
             param_name = f"{prefix}{field_name}"
             
             if isinstance(value, (int, float, str, bool)):
                 # Try to find the label in param_defs, otherwise use the key name itself
                 label = param_labels.get(field_name, param_name)
                 comment = f"Unit: {label}"
+                # Fusion 360 doesn't like bools, convert to 0/1 here so the writer loop never checks types
+                if isinstance(value, bool):
+                    value = 1 if value else 0
                 flat_list.append((param_name, value, comment))
-            elif hasattr(value, 'model_dump'): # It's a nested Pydantic model
+            elif isinstance(value, dict): # A nested model, already dumped to a plain dict
                 recurse(value, prefix=f"{param_name}_")
 
-    recurse(params)
+    # Dump once and walk plain dicts rather than iterating the Pydantic models field by field
+    recurse(params.model_dump(mode='python'))
     return flat_list
 
-def export_params_to_fusion_csv(params: MotorParams, param_defs: dict) -> str:
+# Same write buffer as utils.io
+_BUFFER_SIZE = 1 << 16
+
+_CSV_HEADER = "Parameter Name,Expression,Comment\n"
+_CSV_SPECIAL = (',', '"', '\n', '\r')
+
+def _esc(text: str) -> str:
+    """Quotes a CSV field the way csv.writer's QUOTE_MINIMAL does (carriage returns are dropped, as before)."""
+    if any(ch in text for ch in _CSV_SPECIAL):
+        return ('"' + text.replace('"', '""') + '"').replace('\r', '')
+    return text
+
+def _cell(value) -> str:
+    """Formats a value as csv.writer would: str subclasses (e.g. str enums) by their string value, numbers via str()."""
+    if isinstance(value, str):
+        return _esc(str.__str__(value))
+    return str(value)
+
+def _iter_csv_rows(params: MotorParams, param_defs: Optional[dict]) -> Iterator[str]:
+    """Yields the Fusion 360 CSV as formatted lines, header first; numbers never need quoting."""
+    yield _CSV_HEADER
+    for name, value, comment in _flatten_params(params, param_defs):
+        # Handle empty description separately to avoid "Unit: " prefix
+        if name == 'description' and not value:
+            yield f"{name},,\n"
+        else:
+            yield f"{name},{_cell(value)},{_esc(comment)}\n"
+
+def export_params_to_fusion_csv(params: MotorParams, param_defs: Optional[dict] = None) -> str:
     """
     Exports motor parameters to a CSV string compatible with Fusion 360.
     
     Args:
         params: The MotorParams object.
-        param_defs: The UI parameter definitions for unit lookup.
+        param_defs: The UI parameter definitions for unit lookup. Defaults to the
+            definitions registered with set_default_param_defs.
+
+    Raises:
+        ValueError: If `param_defs` is omitted and no defaults have been registered.
 
     Returns:
         A string containing the CSV data.
     """
-    flat_params = _flatten_params(params, param_defs)
-    
-    output = io.StringIO(newline='')
-    writer = csv.writer(output)
-    
-    # Write header
-    writer.writerow(["Parameter Name", "Expression", "Comment"])
-    
-    # Write data
-    for name, value, comment in flat_params:
-        # Fusion 360 doesn't like bools, convert to 0/1
-        if isinstance(value, bool):
-            value = 1 if value else 0
-        
-        # Handle empty description separately to avoid "Unit: " prefix
-        if name == 'description' and not value:
-            writer.writerow([name, "", ""])
-        else:
-            writer.writerow([name, value, comment])
-        
-    return output.getvalue().replace('\r', '')
+    return "".join(_iter_csv_rows(params, param_defs))
+
+def export_params_to_fusion_csv_to_path(params: MotorParams, filepath: str, param_defs: Optional[dict] = None):
+    """
+    Writes the Fusion 360 CSV for `params` to `filepath`, row by row, without building the
+    whole document in memory first. Rows go to a temporary file beside `filepath` that
+    replaces it only once complete, so a failed export leaves any existing file untouched.
+
+    Args:
+        params: The MotorParams object.
+        filepath: Destination CSV file.
+        param_defs: As for export_params_to_fusion_csv.
+    """
+    filepath = os.fspath(filepath)
+    directory, name = os.path.split(filepath)
+    tmp_path = os.path.join(directory, f".{name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'x', newline='', encoding='utf-8', buffering=_BUFFER_SIZE) as f:
+            f.writelines(_iter_csv_rows(params, param_defs))
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 if __name__ == '__main__':
     # Example usage for direct testing
@@ -2,23 +2,51 @@ import json
 from typing import Any
 from ..exceptions import FileOperationError
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+# Result dumps from run_cli reach megabytes; a 64 KB buffer keeps the write() syscall count down
+_BUFFER_SIZE = 1 << 16
+
+def _json_default(obj: Any) -> Any:
+    """Serialises NumPy arrays and scalars (anything with a tolist()) that the encoder cannot handle natively."""
+    tolist = getattr(obj, 'tolist', None)
+    if tolist is not None:
+        return tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 def save_json(filepath: str, data: Any):
+    """
+    Writes `data` as indented JSON. NumPy arrays and scalars may be passed directly.
+    orjson (when installed) indents by 2 and writes NaN/inf as null; the stdlib path keeps
+    its 4-space indent and NaN/Infinity literals.
+    """
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            with open(filepath, 'wb', buffering=_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(data, default=_json_default, option=option))
+        else:
+            with open(filepath, 'w', encoding='utf-8', buffering=_BUFFER_SIZE) as f:
+                json.dump(data, f, indent=4, ensure_ascii=False, default=_json_default)
     except (IOError, TypeError) as e:
         raise FileOperationError(f"Failed to save JSON to {filepath}: {e}") from e
 
 def load_json(filepath: str) -> Any:
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        if orjson is not None:
+            with open(filepath, 'rb', buffering=_BUFFER_SIZE) as f:
+                return orjson.loads(f.read())
+        with open(filepath, 'r', encoding='utf-8', buffering=_BUFFER_SIZE) as f:
             return json.load(f)
     except (IOError, json.JSONDecodeError) as e:
         raise FileOperationError(f"Failed to load JSON from {filepath}: {e}") from e
 
 def save_text(filepath: str, content: str):
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
+        with open(filepath, 'w', encoding='utf-8', buffering=_BUFFER_SIZE) as f:
             f.write(content)
     except IOError as e:
         raise FileOperationError(f"Failed to save text to {filepath}: {e}") from e
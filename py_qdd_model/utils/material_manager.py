@@ -1,33 +1,61 @@
 import json
 from pathlib import Path
-from typing import Dict, Any, Type, Optional, List
-from functools import lru_cache
+from typing import Dict, Any, Type, Optional, List, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
 
 # Assuming these Pydantic models are defined in schema.py or a dedicated material_schema.py
 # For now, we'll use a generic Dict[str, Any] for loaded material data.
 # In a later step, we would validate these against specific Pydantic models.
 
+# Upper bound on concurrent material file reads
+_MAX_READ_WORKERS = 8
+
+def _read_bytes(file_path: Path) -> Any:
+    """Reads a file for the loader threads, returning the exception instead of raising it."""
+    try:
+        return file_path.read_bytes()
+    except Exception as e:
+        return e
+
+# Parsed material directories, keyed by path. An entry is reused while the directory's sorted
+# (file name, mtime) listing is unchanged, so re-creating the manager does not re-parse unchanged files.
+_DIR_CACHE: Dict[Path, Tuple[Tuple[Tuple[str, int], ...], Dict[str, Any]]] = {}
+
 class MaterialManager:
+    # Per-instance state lives in slots, set up once in __new__; _instance and _base_path stay class attributes
+    __slots__ = ('_materials', '_names_by_type', '_loaded_types')
+    _materials: Dict[Tuple[str, str], Dict[str, Any]]
+    _names_by_type: Dict[str, List[str]]
+    _loaded_types: Set[str]
+
     _instance: Optional['MaterialManager'] = None
-    _materials: Dict[str, Dict[str, Any]] = {}
     _base_path: Path = Path(__file__).parent.parent.parent / "parameters"
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(MaterialManager, cls).__new__(cls)
-            cls._instance._load_all_materials()
+            # Each material type is read from disk on its first lookup, not at construction
+            # Materials are keyed flat by (type, name) so a lookup is a single hash probe
+            cls._instance._materials = {}
+            cls._instance._names_by_type = {}
+            cls._instance._loaded_types = set()
         return cls._instance
 
-    def _load_all_materials(self):
-        """Scans the parameters directory and loads all material JSON files."""
-        self._materials = {
-            "core_materials": self._load_materials_from_dir("core_materials"),
-            "magnet_materials": self._load_materials_from_dir("magnet_materials"),
-            "wire_materials": self._load_materials_from_dir("wire_materials"),
-        }
-        print(f"MaterialManager loaded: {len(self._materials['core_materials'])} core, "
-              f"{len(self._materials['magnet_materials'])} magnet, "
-              f"{len(self._materials['wire_materials'])} wire materials.")
+    def _ensure_loaded(self, material_type: str):
+        """Loads the subdirectory of one material type on its first use."""
+        if material_type in self._loaded_types:
+            return
+        materials = self._load_materials_from_dir(material_type)
+        for name, data in materials.items():
+            self._materials[(material_type, name)] = data
+        self._names_by_type[material_type] = list(materials)
+        self._loaded_types.add(material_type)
+        print(f"MaterialManager loaded {len(materials)} {material_type}.")
 
     def _load_materials_from_dir(self, sub_dir: str) -> Dict[str, Any]:
         """Loads JSON files from a specified subdirectory."""
@@ -37,28 +65,56 @@ class MaterialManager:
             print(f"Warning: Material directory '{dir_path}' not found.")
             return materials_dict
 
-        for file_path in dir_path.glob("*.json"):
+        file_paths = sorted(dir_path.glob("*.json"))
+        try:
+            signature = tuple((p.name, p.stat().st_mtime_ns) for p in file_paths)
+        except OSError:
+            signature = None  # A file vanished mid-scan; parse what is there and do not cache it
+        cached = _DIR_CACHE.get(dir_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        # Reads are I/O-bound and release the GIL, so issue them concurrently; parsing stays on this thread
+        if len(file_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(file_paths))) as ex:
+                contents = list(ex.map(_read_bytes, file_paths))
+        else:
+            contents = [_read_bytes(p) for p in file_paths]
+
+        for file_path, raw in zip(file_paths, contents):
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if "name" in data:
-                        materials_dict[data["name"]] = data
-                    else:
-                        print(f"Warning: Material file '{file_path.name}' has no 'name' field. Skipping.")
+                if isinstance(raw, Exception):
+                    raise raw
+                # orjson decodes the UTF-8 bytes itself; its JSONDecodeError subclasses json's
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                if "name" in data:
+                    materials_dict[data["name"]] = data
+                else:
+                    print(f"Warning: Material file '{file_path.name}' has no 'name' field. Skipping.")
             except json.JSONDecodeError as e:
                 print(f"Error loading material file '{file_path.name}': {e}")
             except Exception as e:
                 print(f"An unexpected error occurred loading '{file_path.name}': {e}")
+        if signature is not None:
+            _DIR_CACHE[dir_path] = (signature, materials_dict)
         return materials_dict
 
-    @lru_cache(maxsize=None) # Cache material lookups
+    def refresh(self):
+        """Forgets all loaded materials so the next lookups re-read the material directories from disk."""
+        self._materials.clear()
+        self._names_by_type.clear()
+        self._loaded_types.clear()
+        _DIR_CACHE.clear()
+
     def get_material(self, material_type: str, name: str) -> Optional[Dict[str, Any]]:
-        """Retrieves a specific material by type and name."""
-        return self._materials.get(material_type, {}).get(name)
+        """Retrieves a specific material by type and name. The same dict object is returned on every call."""
+        self._ensure_loaded(material_type)
+        return self._materials.get((material_type, name))
 
     def get_available_materials(self, material_type: str) -> List[str]:
-        """Returns a list of names of available materials for a given type."""
-        return list(self._materials.get(material_type, {}).keys())
+        """Returns a list of names of available materials for a given type. The list is shared; do not modify it."""
+        self._ensure_loaded(material_type)
+        return self._names_by_type.get(material_type, [])
 
 # Create a global instance for easy access
 material_manager = MaterialManager()
@@ -1,10 +1,59 @@
+import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+def _grid_quads(X, Y, Z, stride: int):
+    """
+    Builds the (n_faces, 4, 3) corner array of a strided surface grid in one vectorised pass.
+    Faces touching a non-finite vertex (e.g. the NaN-masked region over the voltage limit) are dropped.
+    """
+    rows, cols = Z.shape
+    r = np.append(np.arange(0, rows - 1, stride), rows - 1)
+    c = np.append(np.arange(0, cols - 1, stride), cols - 1)
+    r0, r1 = np.ix_(r[:-1], c[:-1]), np.ix_(r[1:], c[:-1])
+    r0c1, r1c1 = np.ix_(r[:-1], c[1:]), np.ix_(r[1:], c[1:])
+    polys = np.stack(
+        [np.stack([a[r0], a[r0c1], a[r1c1], a[r1]], axis=-1) for a in (X, Y, Z)],
+        axis=-1,
+    ).reshape(-1, 4, 3)
+    return polys[np.isfinite(polys).all(axis=(1, 2))]
+
+def _stride(shape, downsample_factor: int) -> int:
+    """Grid stride for the surface; a factor <= 0 picks one that keeps about 64 faces along the longer axis."""
+    if downsample_factor <= 0:
+        return max(1, max(shape) // 64)
+    return downsample_factor
 
 def plot_surface(ax, X, Y, Z, xlabel='I', ylabel='RPM', zlabel='Z', title='', downsample_factor: int = 1):
-    surf = ax.plot_surface(X, Y, Z, cmap='plasma', rstride=downsample_factor, cstride=downsample_factor, alpha=0.9, antialiased=True, linewidth=0)
+    X, Y, Z = np.broadcast_arrays(X, Y, Z)
+    stride = _stride(Z.shape, downsample_factor)
+    # rasterized: vector outputs (PDF/SVG) embed the surface as one image instead of thousands of quads
+    if min(Z.shape) < 2:
+        surf = ax.plot_surface(X, Y, Z, cmap='plasma', rstride=stride, cstride=stride, alpha=0.9, antialiased=True, linewidth=0, rasterized=True)
+    else:
+        # Equivalent to Axes3D.plot_surface on a uniform grid, but it avoids the per-polygon
+        # Python loop matplotlib falls back to whenever Z contains NaN.
+        polys = _grid_quads(X, Y, Z, stride)
+        surf = Poly3DCollection(polys, cmap='plasma', alpha=0.9, antialiased=True, linewidth=0, rasterized=True)
+        surf.set_array(polys[..., 2].mean(axis=-1))
+        had_data = ax.has_data()
+        ax.add_collection(surf)
+        ax.auto_scale_xyz(X, Y, Z, had_data)
     ax.set_xlabel(xlabel)
     ax.set_ylabel(ylabel)
     ax.set_zlabel(zlabel)
     ax.set_title(title, pad=20)
     return surf
+
+def update_surface_data(surf, X, Y, Z, downsample_factor: int = 1):
+    """
+    Refreshes a surface collection built by plot_surface (grids of at least 2x2) in place:
+    the polygon vertices and face colours are replaced, the artist itself is kept on the axes.
+    """
+    X, Y, Z = np.broadcast_arrays(X, Y, Z)
+    polys = _grid_quads(X, Y, Z, _stride(Z.shape, downsample_factor))
+    surf.set_verts(polys)
+    surf.set_array(polys[..., 2].mean(axis=-1))
+    surf.autoscale()  # Re-fit the colour limits to the new values
+    return surf
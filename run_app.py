@@ -1,14 +1,26 @@
-import tkinter as tk
-import matplotlib.pyplot as plt
-from py_qdd_model.ui.main_window import MainWindow
-from py_qdd_model.i18n import translator
-from py_qdd_model.utils.config import settings
+# Delay after the first paint before matplotlib is imported
+_MPL_SETUP_DELAY_MS = 100
+
+def _configure_mpl():
+    # Imported here so matplotlib's import and font setup run after the window has painted
+    import matplotlib
+    matplotlib.rcParams['font.family'] = 'Meiryo'
 
 if __name__ == '__main__':
+    # The UI is imported only here: worker processes re-import this file as their main module
+    # (forkserver/spawn), and must not pull in tkinter and the whole UI stack to run a job
+    import tkinter as tk
+    from py_qdd_model.ui.main_window import MainWindow
+    from py_qdd_model.i18n import translator
+    from py_qdd_model.utils.config import settings
+
     # Set the language before creating any UI components
     translator.set_language(settings.language.lang)
     
-    plt.rcParams['font.family'] = 'Meiryo'
     root = tk.Tk()
     app = MainWindow(master=root)
+    # Tk maps and paints the window in idle handlers, which run only after 'after 0' timers, so flush
+    # them first and configure matplotlib a moment later, once the first frame is on screen
+    root.update_idletasks()
+    root.after(_MPL_SETUP_DELAY_MS, _configure_mpl)
     app.mainloop()
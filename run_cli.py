@@ -3,6 +3,7 @@ import numpy as np
 from py_qdd_model.schema import MotorParams
 from py_qdd_model.models.motor_model import MotorModel
 from py_qdd_model.utils.io import save_json
+from py_qdd_model import constants as C
 
 def run_from_preset(preset_path: str, out_json: str = 'results.json'):
     with open(preset_path, 'r', encoding='utf-8') as f:
@@ -12,20 +13,20 @@ def run_from_preset(preset_path: str, out_json: str = 'results.json'):
     current_range = np.linspace(0.1, params.winding.peak_current, 50)
     # estimate theoretical max rpm similarly as GUI
     if params.winding.wiring_type == 'star':
-        ke_line = model.ke * np.sqrt(3)
+        ke_line = model.ke * C.PhysicsConstants.SQRT3
     else:
         ke_line = model.ke
     if ke_line > 0:
-        motor_rpm_unloaded = params.simulation.bus_voltage / ke_line * (60 / (2 * 3.141592653589793))
+        motor_rpm_unloaded = params.simulation.bus_voltage / ke_line * C.PhysicsConstants.RAD_PER_SEC_TO_RPM
         theoretical_max_rpm = motor_rpm_unloaded / params.gear.gear_ratio
     else:
         theoretical_max_rpm = 5000
     rpm_range = np.linspace(0.1, theoretical_max_rpm * 1.1, 50)
-    I, RPM = np.meshgrid(current_range, rpm_range)
+    # Sparse (1, N) / (M, 1) grids; MotorModel broadcasts them to the full grid
+    I, RPM = np.meshgrid(current_range, rpm_range, sparse=True)
     res = model.analyze(I, RPM)
-    # serialize numeric arrays to lists
-    serial = {k: np.asarray(v).tolist() for k, v in res.items()}
-    save_json(out_json, {'params': data, 'results': serial})
+    # save_json encodes the NumPy result arrays directly
+    save_json(out_json, {'params': data, 'results': res})
     print(f"Saved results to {out_json}")
 
 if __name__ == '__main__':
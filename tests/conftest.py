@@ -0,0 +1,67 @@
+import pytest
+
+
+def _build_params(phase_inductance_uH: float = 100.0):
+    """Builds the default test MotorParams, optionally with another phase inductance in uH."""
+    # Imported here so modules that never request the fixtures do not pull in the model stack at collection
+    from py_qdd_model.schema import MotorParams, ElectricalParams, WindingParams, MagnetParams, GeometricParams, ThermalParams, DriverParams, GearParams, SimulationParams
+
+    return MotorParams(
+        name="Test Motor",
+        description="Motor for testing purposes",
+        motor_type="inner_rotor",
+        electrical=ElectricalParams(
+            kv=100.0,
+        ),
+        winding=WindingParams(
+            phase_resistance=0.1,
+            phase_inductance=phase_inductance_uH,
+            wiring_type='star',
+            continuous_current=15.0,
+            peak_current=30.0,
+            wire_diameter=0.5,
+            turns_per_coil=50,
+        ),
+        magnets=MagnetParams(
+            pole_pairs=7,
+            use_halbach_array=False,
+            magnet_width=10,
+            magnet_thickness=3,
+            magnet_length=20,
+            remanence_br=1.2,
+        ),
+        geometry=GeometricParams(
+            motor_outer_diameter=60,
+            motor_inner_diameter=30,
+            motor_length=25,
+            slot_number=12,
+        ),
+        thermal=ThermalParams(
+            thermal_resistance=2.0,  # °C/W
+            ambient_temperature=25.0,
+        ),
+        driver=DriverParams(
+            driver_on_resistance=0.005,
+            driver_fixed_loss=2.0,
+        ),
+        gear=GearParams(
+            gear_ratio=9.0,
+            gear_efficiency=0.95,
+        ),
+        simulation=SimulationParams(
+            bus_voltage=48.0,
+        )
+    )
+
+@pytest.fixture(scope="session")
+def build_params():
+    """Provides the MotorParams builder, for tests that need a fresh params object."""
+    return _build_params
+
+@pytest.fixture(scope="session")
+def default_model():
+    """Provides a default MotorModel instance for testing, shared by the whole session; tests must not mutate it."""
+    from py_qdd_model.models.motor_model import MotorModel
+
+    # The MotorModel __init__ is responsible for converting uH to H for internal use
+    return MotorModel(_build_params())
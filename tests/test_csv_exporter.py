@@ -1,7 +1,8 @@
 import pytest
 import pytest
 from py_qdd_model.schema import MotorParams, ElectricalParams, WindingParams, MagnetParams, GeometricParams, ThermalParams, DriverParams, GearParams, SimulationParams, MotorType
-from py_qdd_model.utils.csv_exporter import export_params_to_fusion_csv
+from py_qdd_model.utils import csv_exporter
+from py_qdd_model.utils.csv_exporter import export_params_to_fusion_csv, export_params_to_fusion_csv_to_path, set_default_param_defs
 # from py_qdd_model.ui import constants as C_UI # For param_defs
 
 @pytest.fixture
@@ -146,3 +147,36 @@ def test_export_csv_edge_cases(base_motor_params):
 
     # Test for a label with no unit
     assert "winding_phase_inductance,150.0,Unit: Inductance" in csv_string
+
+def test_export_csv_default_param_defs(base_motor_params, english_param_defs, monkeypatch):
+    """Test that registered default param_defs are used when none are passed."""
+    # monkeypatch restores the module-global defaults afterwards, so they do not leak into other tests
+    monkeypatch.setattr(csv_exporter, "_DEFAULT_LABELS", None)
+    set_default_param_defs(english_param_defs)
+    assert export_params_to_fusion_csv(base_motor_params) == export_params_to_fusion_csv(base_motor_params, english_param_defs)
+
+def test_export_csv_without_param_defs_raises(base_motor_params, monkeypatch):
+    """Test that omitting param_defs with no registered defaults is an error rather than an unlabeled export."""
+    monkeypatch.setattr(csv_exporter, "_DEFAULT_LABELS", None)
+    with pytest.raises(ValueError):
+        export_params_to_fusion_csv(base_motor_params)
+
+def test_export_csv_to_path(base_motor_params, english_param_defs, tmp_path):
+    """Test that the streamed file matches the in-memory CSV."""
+    out = tmp_path / "params.csv"
+    export_params_to_fusion_csv_to_path(base_motor_params, out, english_param_defs)
+    assert out.read_text(encoding='utf-8') == export_params_to_fusion_csv(base_motor_params, english_param_defs)
+
+def test_export_csv_to_path_failure_keeps_existing_file(base_motor_params, english_param_defs, tmp_path, monkeypatch):
+    """Test that a failed export leaves the destination file as it was."""
+    out = tmp_path / "params.csv"
+    out.write_text("previous", encoding='utf-8')
+
+    def fail(*args):
+        raise ValueError("flatten failed")
+    monkeypatch.setattr(csv_exporter, "_flatten_params", fail)
+
+    with pytest.raises(ValueError):
+        export_params_to_fusion_csv_to_path(base_motor_params, out, english_param_defs)
+    assert out.read_text(encoding='utf-8') == "previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["params.csv"]
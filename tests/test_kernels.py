@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from py_qdd_model.models import _kernels
+
+
+@pytest.fixture(params=["compiled", "numpy"])
+def kernel_path(request, monkeypatch):
+    """Runs a test through the numba kernels (when installed) and through the NumPy fallbacks."""
+    if request.param == "compiled":
+        if _kernels.njit is None:
+            pytest.skip("numba is not installed")
+    else:
+        monkeypatch.setattr(_kernels, "njit", None)
+    return request.param
+
+def test_masked_argmax_respects_voltage_mask(kernel_path):
+    volt = np.array([1.0, 5.0, 1.0, 1.0])
+    values = np.array([0.2, 0.9, 0.5, 0.5])
+    # Cell 1 is over the limit; the first of the tied maxima wins
+    assert list(_kernels.masked_argmax(volt, 2.0, values)) == [2]
+
+def test_masked_argmax_no_valid_cells(kernel_path):
+    volt = np.full(3, 10.0)
+    assert list(_kernels.masked_argmax(volt, 2.0, np.ones(3), np.zeros(3))) == [-1, -1]
+
+def test_masked_argmax_ignores_nan(kernel_path):
+    volt = np.zeros(4)
+    values = np.array([0.1, np.nan, 0.7, 0.3])
+    leading_nan = np.array([np.nan, -np.inf, 0.2, np.nan])
+    all_nan = np.full(4, np.nan)
+    assert list(_kernels.masked_argmax(volt, 1.0, values, leading_nan, all_nan)) == [2, 2, -1]
+
+def test_mask_scale(kernel_path):
+    src = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    volt = np.array([[1.0, 3.0, 2.0], [0.0, 2.5, 1.0]])
+    out = np.empty_like(src)
+    result = _kernels.mask_scale(src, volt, 2.0, 10.0, out)
+    assert result is out
+    np.testing.assert_array_equal(out, [[10.0, np.nan, 30.0], [40.0, np.nan, 60.0]])
+
+def test_mask_scale_non_contiguous_out(kernel_path):
+    src = np.arange(6, dtype=np.float32).reshape(2, 3)
+    volt = np.array([[0.0, 5.0, 0.0], [5.0, 0.0, 5.0]])
+    # A transposed view: the result must land in the caller's buffer, not in a temporary copy
+    out = np.zeros((3, 2), dtype=np.float32).T
+    assert not out.flags.c_contiguous
+    _kernels.mask_scale(src, volt, 1.0, np.float32(2.0), out)
+    np.testing.assert_array_equal(out, [[0.0, np.nan, 4.0], [np.nan, 8.0, np.nan]])
+
+@pytest.mark.parametrize("total_loss", [np.array([[10.0, 20.0], [0.0, 5.0]]), 3.0])
+def test_relax_temperature_matches_formula(kernel_path, total_loss):
+    prev = np.array([[25.0, 40.0], [30.0, 80.0]])
+    temp, res, converged = _kernels.relax_temperature(prev, total_loss, 25.0, 2.0, 0.5, 0.1, 0.004, 20.0, 0.01)
+    expected_temp = prev + 0.5 * (25.0 + np.asarray(total_loss) * 2.0 - prev)
+    np.testing.assert_allclose(temp, expected_temp)
+    np.testing.assert_allclose(res, 0.1 * (1 + 0.004 * (expected_temp - 20.0)))
+    assert temp.shape == prev.shape and temp.dtype == prev.dtype
+    assert not converged
+
+def test_relax_temperature_converged(kernel_path):
+    prev = np.array([45.0, 35.0])
+    _, _, converged = _kernels.relax_temperature(prev, np.array([10.0, 5.0]), 25.0, 2.0, 0.5, 0.1, 0.004, 20.0, 0.01)
+    assert converged
+
+def test_relax_temperature_nan_is_unconverged(kernel_path):
+    prev = np.array([45.0, np.nan])
+    _, _, converged = _kernels.relax_temperature(prev, np.array([10.0, 5.0]), 25.0, 2.0, 0.5, 0.1, 0.004, 20.0, 0.01)
+    assert not converged
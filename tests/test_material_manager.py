@@ -101,3 +101,16 @@ def test_material_manager_reloads_on_reset(temp_material_dir):
     MaterialManager._instance = None
     manager3 = MaterialManager()
     assert "NewCore" in manager3.get_available_materials("core_materials")
+
+def test_material_manager_refresh_rereads_files(material_manager_instance, temp_material_dir):
+    manager = material_manager_instance
+    assert "RefreshCore" not in manager.get_available_materials("core_materials")
+
+    with open(temp_material_dir / "core_materials" / "RefreshCore.json", "w") as f:
+        json.dump({"name": "RefreshCore", "density": 7800}, f)
+
+    # The loaded type is kept until an explicit refresh
+    assert "RefreshCore" not in manager.get_available_materials("core_materials")
+    manager.refresh()
+    assert "RefreshCore" in manager.get_available_materials("core_materials")
+    assert manager.get_material("core_materials", "RefreshCore")["density"] == 7800
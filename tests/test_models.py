@@ -4,13 +4,16 @@ from pydantic import ValidationError
 from py_qdd_model.models.base_loss import LossModel
 from py_qdd_model.models.copper_loss import CopperLossModel
 from py_qdd_model.models.iron_loss import IronLossModel
-from py_qdd_model.schema import MotorParams, ElectricalParams, WindingParams, MagnetParams, GeometricParams, ThermalParams, DriverParams, GearParams, SimulationParams
+from py_qdd_model.schema import WindingParams, GeometricParams, GearParams
 from py_qdd_model.models.motor_model import MotorModel
 from py_qdd_model import constants as C
 
+# 1x1 grid for single-point analyses; scale it rather than building a new nested array in each test
+_ONE11 = np.ones((1, 1))
+
 def test_copper_star():
     m = CopperLossModel('star')
-    assert np.isclose(m.calculate_loss(10, 0.1), 3 * 100 * 0.1)
+    assert m.calculate_loss(10, 0.1) == pytest.approx(3 * 100 * 0.1)
 
 def test_iron_loss():
     m = IronLossModel(0.001, 1e-7, pole_pairs=7)
@@ -36,133 +39,95 @@ def test_base_loss_model_abstract():
         IncompleteLossModel()
 
 
-@pytest.fixture
-def default_model():
-    """Provides a default MotorModel instance for testing."""
-    params = MotorParams(
-        name="Test Motor",
-        description="Motor for testing purposes",
-        motor_type="inner_rotor",
-        electrical=ElectricalParams(
-            kv=100.0,
-        ),
-        winding=WindingParams(
-            phase_resistance=0.1,
-            phase_inductance=100.0,  # uH
-            wiring_type='star',
-            continuous_current=15.0,
-            peak_current=30.0,
-            wire_diameter=0.5,
-            turns_per_coil=50,
-        ),
-        magnets=MagnetParams(
-            pole_pairs=7,
-            use_halbach_array=False,
-            magnet_width=10,
-            magnet_thickness=3,
-            magnet_length=20,
-            remanence_br=1.2,
-        ),
-        geometry=GeometricParams(
-            motor_outer_diameter=60,
-            motor_inner_diameter=30,
-            motor_length=25,
-            slot_number=12,
-        ),
-        thermal=ThermalParams(
-            thermal_resistance=2.0,  # °C/W
-            ambient_temperature=25.0,
-        ),
-        driver=DriverParams(
-            driver_on_resistance=0.005,
-            driver_fixed_loss=2.0,
-        ),
-        gear=GearParams(
-            gear_ratio=9.0,
-            gear_efficiency=0.95,
-        ),
-        simulation=SimulationParams(
-            bus_voltage=48.0,
-        )
-    )
-    # The MotorModel __init__ is responsible for converting uH to H for internal use
-    return MotorModel(params)
+@pytest.fixture(scope="module")
+def voltage_limits(default_model):
+    """(ke_line, motor RPM limit, shaft RPM limit) at which back-EMF alone reaches the bus voltage."""
+    model = default_model
+    # Ke in V/(rad/s) for star wiring is kt * sqrt(3)
+    ke_line = model.ke * C.PhysicsConstants.SQRT3
+    rpm_limit_motor = model.p.simulation.bus_voltage / ke_line * C.PhysicsConstants.RAD_PER_SEC_TO_RPM
+    return ke_line, rpm_limit_motor, rpm_limit_motor / model.p.gear.gear_ratio
+
+@pytest.fixture(scope="module")
+def big_sweep(default_model, voltage_limits):
+    """
+    Analyses, in one call, every operating point the read-only model tests check. Rows [:-1] are a
+    current x RPM sweep covering the voltage-limited region; the last row holds the single points,
+    whose (row, column) indices are given by the returned `points` dict.
+    """
+    model = default_model
+    _, _, rpm_limit_shaft = voltage_limits
 
-def test_motor_analyze_shapes(default_model):
+    # Use a range that covers the likely peak efficiency area
+    I = np.linspace(1.0, model.p.winding.peak_current, 20)
+    RPM = np.linspace(100, rpm_limit_shaft * 1.2, 20) # Use realistic RPM range
+    single_points = {
+        'high_current': (model.p.winding.peak_current * 0.9, 300.0), # High current, low shaft RPM to avoid the voltage limit
+        'over_limit': (1.0, rpm_limit_shaft * 1.1), # Low current to minimize resistive drop
+        'under_limit': (1.0, rpm_limit_shaft * 0.9),
+    }
+
+    Ig = np.empty((RPM.size + 1, I.size))
+    Rg = np.empty_like(Ig)
+    Ig[:-1], Rg[:-1] = np.meshgrid(I, RPM)
+    # Unused cells of the last row repeat the first sweep point. Each cell's physics is elementwise, but the
+    # thermal loop stops on one convergence check over the whole grid, so the extra row can only add
+    # relaxation steps (moving every cell closer to its fixed point); the assertions below allow for that.
+    Ig[-1], Rg[-1] = I[0], RPM[0]
+    points = {}
+    for col, (name, (current, rpm)) in enumerate(single_points.items()):
+        Ig[-1, col], Rg[-1, col] = current, rpm
+        points[name] = (Ig.shape[0] - 1, col)
+    return Ig, Rg, model.analyze(Ig, Rg), points
+
+@pytest.fixture(scope="module")
+def analyze_grid_converged(default_model):
+    """A small grid analysed with extra thermal iterations and heavier relaxation."""
     model = default_model
     I = np.linspace(0.1, model.p.winding.peak_current, 5)
     RPM = np.linspace(100, 1000, 5)
-    Ig, Rg = np.meshgrid(I, RPM)
-    res = model.analyze(Ig, Rg)
-    assert 'efficiency' in res and res['efficiency'].shape == Ig.shape
+    Ig, Rg = I[np.newaxis, :], RPM[:, np.newaxis]
+    return Ig, Rg, model.analyze(Ig, Rg, iters=100, relax=0.3)
+
+def test_motor_analyze_shapes(big_sweep):
+    Ig, Rg, res, _ = big_sweep
+    assert 'efficiency' in res and res['efficiency'].shape == np.broadcast_shapes(Ig.shape, Rg.shape)
 
-def test_temperature_convergence(default_model):
+def test_temperature_convergence(default_model, analyze_grid_converged):
     model = default_model
-    I = np.linspace(0.1, model.p.winding.peak_current, 5)
-    RPM = np.linspace(100, 1000, 5)
-    Ig, Rg = np.meshgrid(I, RPM)
-    res = model.analyze(Ig, Rg, iters=100, relax=0.3)
+    Ig, Rg, res = analyze_grid_converged
     assert 'motor_temp' in res
     assert np.all(np.isfinite(res['motor_temp']))
     assert np.nanmin(res['motor_temp']) >= model.p.thermal.ambient_temperature - 1e-3
 
-def test_thermal_convergence_high_current(default_model):
+def test_thermal_convergence_high_current(default_model, big_sweep):
     """Tests if temperature rises significantly under high load."""
     model = default_model
-    # Analyze a single high-current, but low-RPM point to avoid voltage limit
-    current = np.array([[model.p.winding.peak_current * 0.9]])
-    rpm = np.array([[300.0]]) # Shaft RPM
-    res = model.analyze(current, rpm)
-    final_temp = res['motor_temp'][0, 0]
+    _, _, res, points = big_sweep
+    final_temp = res['motor_temp'][points['high_current']]
     # Assert that the temperature has risen by a plausible amount (e.g., > 10°C)
     assert final_temp > model.p.thermal.ambient_temperature + 10.0
 
-def test_voltage_limit_boundary(default_model):
+def test_voltage_limit_boundary(default_model, big_sweep):
     """Tests if the calculated voltage correctly reflects the voltage limit."""
     model = default_model
-    # Ke in V/(rad/s) for star wiring is kt * sqrt(3)
-    ke_line = model.ke * np.sqrt(3)
-    
-    # Find MOTOR RPM where back-EMF alone would exceed bus voltage
-    rpm_limit_motor = model.p.simulation.bus_voltage / ke_line * C.PhysicsConstants.RAD_PER_SEC_TO_RPM
-    
-    # Convert to SHAFT RPM limit
-    rpm_limit_shaft = rpm_limit_motor / model.p.gear.gear_ratio
-
-    # Test a point expected to be OVER the voltage limit
-    rpm_over = np.array([[rpm_limit_shaft * 1.1]])
-    current_low = np.array([[1.0]]) # Low current to minimize resistive drop
-    res_over = model.analyze(current_low, rpm_over)
-    assert res_over['voltage'][0, 0] > model.p.simulation.bus_voltage
-
-    # Test a point expected to be UNDER the voltage limit
-    rpm_under = np.array([[rpm_limit_shaft * 0.9]])
-    res_under = model.analyze(current_low, rpm_under)
-    assert res_under['voltage'][0, 0] < model.p.simulation.bus_voltage
+    _, _, res, points = big_sweep
+    # Points just OVER and just UNDER the shaft RPM where back-EMF alone reaches the bus voltage
+    assert res['voltage'][points['over_limit']] > model.p.simulation.bus_voltage
+    assert res['voltage'][points['under_limit']] < model.p.simulation.bus_voltage
 
-def test_efficiency_peak_location(default_model):
+def test_efficiency_peak_location(default_model, big_sweep):
     """Tests for a plausible peak efficiency location."""
     model = default_model
+    _, _, res, _ = big_sweep
     
-    # --- Calculate a realistic RPM range based on voltage limit ---
-    ke_line = model.ke * np.sqrt(3)
-    rpm_limit_motor = model.p.simulation.bus_voltage / ke_line * C.PhysicsConstants.RAD_PER_SEC_TO_RPM
-    rpm_limit_shaft = rpm_limit_motor / model.p.gear.gear_ratio
-    
-    # Use a range that covers the likely peak efficiency area
-    I = np.linspace(1.0, model.p.winding.peak_current, 20)
-    RPM = np.linspace(100, rpm_limit_shaft * 1.2, 20) # Use realistic RPM range
-    Ig, Rg = np.meshgrid(I, RPM)
-    
-    res = model.analyze(Ig, Rg)
-    
-    # Mask out areas over the voltage limit, as they are not valid operating points
-    valid_mask = res['voltage'] <= model.p.simulation.bus_voltage
-    efficiency = np.where(valid_mask, res['efficiency'], 0)
+    # Only the sweep rows; mask out areas over the voltage limit, as they are not valid operating points
+    valid_mask = res['voltage'][:-1] <= model.p.simulation.bus_voltage
+    efficiency = res['efficiency'][:-1]
     
-    # Find peak efficiency
-    max_eff = np.max(efficiency)
-    peak_idx = np.unravel_index(np.argmax(efficiency), efficiency.shape)
+    # Find peak efficiency; the max reduces over valid cells in place, argmax (which has no where=) sees -inf elsewhere
+    max_eff = np.max(efficiency, where=valid_mask, initial=-np.inf)
+    peak_idx = np.unravel_index(np.argmax(np.where(valid_mask, efficiency, -np.inf)), efficiency.shape)
     
     # Assert that peak efficiency is a reasonable value
     assert 0.5 < max_eff < 0.99
@@ -172,44 +137,11 @@ def test_efficiency_peak_location(default_model):
     assert peak_idx[0] > 0  # Not at the lowest RPM
     assert peak_idx[1] > 0  # Not at the lowest Current
 
-def test_motor_model_inductance_conversion():
+@pytest.mark.parametrize("uH, expected_H", [(100.0, 1e-4), (150.0, 1.5e-4)])
+def test_motor_model_inductance_conversion(build_params, uH, expected_H):
     """Tests that the model correctly converts inductance from uH to H on initialization."""
-    params_in_uh = MotorParams(
-        name="Inductance Test Motor",
-        motor_type="inner_rotor",
-        electrical=ElectricalParams(kv=100.0),
-        winding=WindingParams(
-            phase_resistance=0.1,
-            continuous_current=10.0,
-            peak_current=30.0,
-            phase_inductance=150.0,  # The value being tested (uH)
-            wire_diameter=0.5,
-            turns_per_coil=50,
-        ),
-        magnets=MagnetParams(
-            pole_pairs=7,
-            use_halbach_array=False,
-            magnet_width=10,
-            magnet_thickness=3,
-            magnet_length=20,
-            remanence_br=1.2,
-        ),
-        geometry=GeometricParams(
-            motor_outer_diameter=60,
-            motor_inner_diameter=30,
-            motor_length=25,
-            slot_number=12,
-        ),
-        thermal=ThermalParams(),
-        driver=DriverParams(),
-        gear=GearParams(),
-        simulation=SimulationParams(),
-    )
-    
-    model = MotorModel(params_in_uh)
-    
-    expected_h = 150e-6
-    assert model.p.winding.phase_inductance == pytest.approx(expected_h)
+    model = MotorModel(build_params(uH))
+    assert model.p.winding.phase_inductance == pytest.approx(expected_H)
 
 def test_winding_params_validation():
     """Tests validation for WindingParams."""
@@ -237,23 +169,21 @@ def test_gear_params_validation():
 
 def test_zero_ke_edge_case(default_model):
     """Tests the edge case where Ke is zero or near-zero."""
-    # A very high KV results in a very low Ke
-    default_model.p.electrical.kv = 1e9 
-    model = MotorModel(default_model.p)
+    # A very high KV results in a very low Ke; work on a copy so the shared fixture stays untouched
+    params = default_model.p.model_copy(deep=True)
+    params.electrical.kv = 1e9
+    model = MotorModel(params)
 
     assert model.ke == pytest.approx(0, abs=1e-8)
 
-    # Ensure analysis runs without division by zero errors
-    I = np.linspace(0.1, model.p.winding.peak_current, 5)
-    # The RPM range should now be based on the fallback
-    expected_rpm_range = np.linspace(0.1, C.ModelDefaults.FALLBACK_MAX_RPM * 1.0, 5)
-    
-    Ig, Rg = np.meshgrid(I, expected_rpm_range)
+    # Ensure analysis runs without division by zero errors; one point inside the fallback RPM range is enough
+    Ig = _ONE11 * 1.0
+    Rg = _ONE11 * (C.ModelDefaults.FALLBACK_MAX_RPM * 0.5)
     res = model.analyze(Ig, Rg)
 
     # Check that the results are valid and have the correct shape
-    assert 'efficiency' in res and res['efficiency'].shape == Ig.shape
-    assert np.all(np.isfinite(res['torque']))
+    assert 'efficiency' in res and res['efficiency'].shape == (1, 1)
+    assert res['torque'].shape == (1, 1) and np.all(np.isfinite(res['torque']))
 
 def test_geometric_params_validation():
     """Tests validation for GeometricParams."""
@@ -1,20 +1,23 @@
 import pytest
-from pathlib import Path
-import tempfile
-import os
 
 from py_qdd_model.schema import MotorParams, ElectricalParams, WindingParams, MagnetParams, GeometricParams, ThermalParams, DriverParams, GearParams, SimulationParams, MotorType
 from py_qdd_model.three_d.model_generator import generate_motor_model
 
-@pytest.fixture
-def temp_output_dir():
-    """Provides a temporary directory for test output files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+@pytest.fixture(scope="module")
+def temp_output_root(tmp_path_factory):
+    """One temporary directory shared by the module's tests."""
+    return tmp_path_factory.mktemp("three_d")
 
 @pytest.fixture
+def temp_output_dir(temp_output_root, request):
+    """Provides a per-test subdirectory for output files, so tests writing the same file name do not collide."""
+    out = temp_output_root / request.node.name
+    out.mkdir()
+    return out
+
+@pytest.fixture(scope="module")
 def base_motor_params():
-    """Provides a base MotorParams instance for testing."""
+    """Provides a base MotorParams instance for testing; tests derive variants with model_copy(update=...) instead of mutating it."""
     return MotorParams(
         name="TestMotor",
         description="A motor for 3D model testing",
@@ -37,10 +40,11 @@ def base_motor_params():
         simulation=SimulationParams(bus_voltage=48.0)
     )
 
-def test_generate_inner_rotor_model(temp_output_dir, base_motor_params):
-    """Test generation of an inner rotor motor model."""
-    params = base_motor_params.model_copy(deep=True)
-    params.motor_type = MotorType.INNER_ROTOR
+@pytest.mark.parametrize("motor_type", [MotorType.INNER_ROTOR, MotorType.OUTER_ROTOR, MotorType.AXIAL_FLUX])
+def test_generate_model(temp_output_dir, base_motor_params, motor_type):
+    """Test generation of an inner rotor, outer rotor and axial flux motor model."""
+    # Shallow copy with the one top-level field replaced; the shared sub-models are never modified
+    params = base_motor_params.model_copy(update={"motor_type": motor_type})
     
     output_path = generate_motor_model(params, temp_output_dir)
     
@@ -49,34 +53,10 @@ def test_generate_inner_rotor_model(temp_output_dir, base_motor_params):
     assert output_path.name == "TestMotor_model.step"
     assert output_path.stat().st_size > 0 # Check if file is not empty
 
-def test_generate_outer_rotor_model(temp_output_dir, base_motor_params):
-    """Test generation of an outer rotor motor model."""
-    params = base_motor_params.model_copy(deep=True)
-    params.motor_type = MotorType.OUTER_ROTOR
-    
-    output_path = generate_motor_model(params, temp_output_dir)
-    
-    assert output_path.exists()
-    assert output_path.suffix == ".step"
-    assert output_path.name == "TestMotor_model.step"
-    assert output_path.stat().st_size > 0
-
-def test_generate_axial_flux_model(temp_output_dir, base_motor_params):
-    """Test generation of an axial flux motor model."""
-    params = base_motor_params.model_copy(deep=True)
-    params.motor_type = MotorType.AXIAL_FLUX
-    
-    output_path = generate_motor_model(params, temp_output_dir)
-    
-    assert output_path.exists()
-    assert output_path.suffix == ".step"
-    assert output_path.name == "TestMotor_model.step"
-    assert output_path.stat().st_size > 0
-
 def test_generate_model_invalid_params(temp_output_dir, base_motor_params):
     """Test generation with invalid parameters (e.g., zero length)."""
-    params = base_motor_params.model_copy(deep=True)
-    params.geometry.motor_length = 0.0 # Invalid length
+    geometry = base_motor_params.geometry.model_copy(update={"motor_length": 0.0}) # Invalid length
+    params = base_motor_params.model_copy(update={"geometry": geometry})
     
     # Expecting an error from cadquery or pydantic validation
     # For now, just ensure it doesn't crash and potentially creates an empty file or raises an error
@@ -3,12 +3,12 @@ from py_qdd_model.models import winding_model
 
 # --- Test Data ---
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def reference_params():
-    """Returns a copy of the built-in medium profile."""
-    return winding_model.BUILTIN_PROFILES["medium"].copy()
+    """Returns the built-in medium profile itself; estimate_new_winding only reads its inputs."""
+    return winding_model.BUILTIN_PROFILES["medium"]
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def target_params():
     """Returns a sample target parameter set."""
     return {